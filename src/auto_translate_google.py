@@ -15,17 +15,36 @@ import os
 import sys
 import time
 import argparse
-import pyperclip
+import contextlib
+import hashlib
+import itertools
+import json
+import re
+import sqlite3
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
+import urllib3
 from pathlib import Path
+from urllib.parse import urlsplit, parse_qs
 from selenium import webdriver
 from selenium.webdriver.edge.service import Service
 from selenium.webdriver.edge.options import Options
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.microsoft import EdgeChromiumDriverManager
 
+# Optional: only needed to paste text when Google ignores scripted input
+try:
+    import pyperclip
+except ImportError:
+    pyperclip = None
+
 
 # Language code mapping for Google Translate
 LANGUAGE_CODES = {
@@ -45,6 +64,116 @@ LANGUAGE_CODES = {
     'hindi': 'hi',
 }
 
+# Lookup by lowercase language name or code (e.g. 'english', 'en', 'zh-cn')
+_ALL_CODES = {
+    'auto': 'auto',
+    **{code.lower(): code for code in LANGUAGE_CODES.values()},
+    **LANGUAGE_CODES,
+}
+
+
+# Free Google Translate endpoint used before falling back to the browser
+HTTP_TRANSLATE_URL = "https://translate.googleapis.com/translate_a/single"
+
+# Persistent translation cache (skips the browser entirely on repeats).
+# Rows hold a SHA-256 of the source text, the language codes and the
+# translation; the source text itself is never stored. The translation
+# is stored as plain text, so process_file() only uses the cache for
+# *_sanitized files unless asked to
+CACHE_PATH = Path.home() / ".cache" / "video2text" / "google_translate.sqlite"
+CACHE_TTL = 30 * 24 * 60 * 60  # 30 days, in seconds
+
+# Cache connections, one per thread, and the database files whose table
+# has been created
+_CACHE = threading.local()
+_CACHE_SCHEMA_READY = set()
+_CACHE_SCHEMA_LOCK = threading.Lock()
+
+
+def _cache_key(text, source_lang, target_lang):
+    """Return the cache key for a translation request."""
+    return hashlib.sha256(f"{source_lang}|{target_lang}|{text}".encode('utf-8')).hexdigest()
+
+
+def _open_cache():
+    """
+    Return this thread's connection to the translation cache database.
+    
+    sqlite3 connections belong to the thread that opened them, so each
+    thread opens one on first use and keeps it for every later lookup.
+    The table is created once per database file.
+    
+    Returns:
+        sqlite3.Connection or None: Open connection, or None if the cache
+        cannot be used
+    """
+    conn = getattr(_CACHE, 'conn', None)
+    if conn is not None and _CACHE.path == CACHE_PATH:
+        return conn
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(CACHE_PATH)
+        with _CACHE_SCHEMA_LOCK:
+            if CACHE_PATH not in _CACHE_SCHEMA_READY:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS translations "
+                    "(hash TEXT PRIMARY KEY, tl TEXT, sl TEXT, result TEXT, ts INTEGER)"
+                )
+                _CACHE_SCHEMA_READY.add(CACHE_PATH)
+    except sqlite3.Error as e:
+        print(f"⚠ Translation cache unavailable: {e}")
+        return None
+    _CACHE.conn, _CACHE.path = conn, CACHE_PATH
+    return conn
+
+
+def get_cached_translation(text, source_lang, target_lang):
+    """
+    Look up a previous translation that is younger than CACHE_TTL.
+    
+    Args:
+        text: Source text
+        source_lang: Source language code
+        target_lang: Target language code
+    
+    Returns:
+        str or None: Cached translation, or None on a miss
+    """
+    conn = _open_cache()
+    if conn is None:
+        return None
+    try:
+        row = conn.execute(
+            "SELECT result FROM translations WHERE hash = ? AND ts >= ?",
+            (_cache_key(text, source_lang, target_lang), int(time.time()) - CACHE_TTL)
+        ).fetchone()
+        return row[0] if row else None
+    except sqlite3.Error:
+        return None
+
+
+def cache_translation(text, source_lang, target_lang, result):
+    """
+    Store a translation in the cache.
+    
+    Args:
+        text: Source text
+        source_lang: Source language code
+        target_lang: Target language code
+        result: Translated text
+    """
+    conn = _open_cache()
+    if conn is None:
+        return
+    try:
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO translations (hash, tl, sl, result, ts) VALUES (?, ?, ?, ?, ?)",
+                (_cache_key(text, source_lang, target_lang), target_lang, source_lang, result, int(time.time()))
+            )
+    except sqlite3.Error as e:
+        print(f"⚠ Could not cache translation: {e}")
+
 
 def get_language_code(language):
     """
@@ -56,30 +185,158 @@ def get_language_code(language):
     Returns:
         str: Language code for Google Translate
     """
-    if not language:
-        return 'auto'
+    lang_lower = (language or 'auto').lower()
+    return _ALL_CODES.get(lang_lower, lang_lower)
+
+
+# Resolved msedgedriver location, reused while the Edge major version matches
+DRIVER_CACHE_PATH = Path.home() / ".cache" / "video2text" / "edgedriver.json"
+
+# Persistent browser profile, so Edge's first-run setup happens only once
+PROFILE_DIR = Path.home() / ".cache" / "video2text" / "edge-profile"
+
+
+def _edge_major_version():
+    """
+    Detect the major version of the installed Microsoft Edge.
     
-    # If already a code, return as-is
-    if len(language) == 2 or (len(language) == 5 and '-' in language):
-        return language.lower()
+    Returns:
+        int or None: Major version, or None if it cannot be determined
+    """
+    if os.name == 'nt':
+        commands = [['reg', 'query', r'HKEY_CURRENT_USER\Software\Microsoft\Edge\BLBeacon', '/v', 'version']]
+    else:
+        commands = [
+            [name, '--version']
+            for name in ('microsoft-edge', 'microsoft-edge-stable', 'msedge',
+                         '/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge')
+        ]
+    
+    for command in commands:
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r'(\d+)\.\d+\.\d+\.\d+', output)
+        if match:
+            return int(match.group(1))
     
-    # Convert name to code
-    lang_lower = language.lower()
-    return LANGUAGE_CODES.get(lang_lower, lang_lower)
+    return None
 
 
-def setup_edge_driver(headless=False):
+def _resolve_driver_path():
+    """
+    Return the msedgedriver path, using the on-disk cache when possible.
+    
+    EdgeChromiumDriverManager().install() makes an HTTP request on every
+    call, so its result is remembered in DRIVER_CACHE_PATH together with
+    the Edge major version and only refreshed when Edge is updated (or the
+    driver file disappears).
+    
+    Returns:
+        str: Path to msedgedriver
+    """
+    edge_major = _edge_major_version()
+    
+    try:
+        cached = json.loads(DRIVER_CACHE_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        cached = {}
+    
+    driver_path = cached.get('driver_path')
+    # An undetectable Edge version keeps the cached driver (works offline)
+    if driver_path and Path(driver_path).exists() and edge_major in (None, cached.get('edge_major')):
+        return driver_path
+    
+    driver_path = EdgeChromiumDriverManager().install()
+    try:
+        DRIVER_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        DRIVER_CACHE_PATH.write_text(
+            json.dumps({'edge_major': edge_major, 'driver_path': driver_path}),
+            encoding='utf-8'
+        )
+    except OSError:
+        pass
+    
+    return driver_path
+
+
+def _enlarge_connection_pool(driver, maxsize=20):
+    """
+    Let the WebDriver client keep more than one connection to msedgedriver.
+    
+    Selenium's command executor uses a urllib3 PoolManager with the
+    default pool size of 1, so commands issued from several threads (e.g.
+    a wait polling while another call runs) queue up and log "connection
+    pool is full" warnings. The manager is rebuilt with the same settings
+    and a larger pool. Older or unusual Selenium setups are left alone.
+    
+    Args:
+        driver: WebDriver instance
+        maxsize: Connections kept per host
+    """
+    try:
+        executor = driver.command_executor
+        manager = executor._conn
+        if type(manager) is not urllib3.PoolManager:
+            return
+        executor._conn = urllib3.PoolManager(**{**manager.connection_pool_kw, 'maxsize': maxsize})
+        manager.clear()
+    except AttributeError:
+        pass
+
+
+def _profile_in_use():
+    """
+    Check whether a running Edge holds PROFILE_DIR.
+    
+    Edge marks a profile as in use with a SingletonLock symlink to
+    "<host>-<pid>" on Linux and macOS, and keeps a "lockfile" open on
+    Windows. A lock left behind by a browser that is gone does not count.
+    
+    Returns:
+        bool: True if another browser is using the profile
+    """
+    lock = PROFILE_DIR / 'SingletonLock'
+    if os.path.lexists(lock):
+        try:
+            pid = int(os.readlink(lock).rsplit('-', 1)[1])
+            os.kill(pid, 0)
+        except (ProcessLookupError, ValueError, IndexError):
+            return False
+        except OSError:
+            pass
+        return True
+    
+    lockfile = PROFILE_DIR / 'lockfile'
+    if os.name == 'nt' and lockfile.exists():
+        try:
+            # Fails while Edge has the file open
+            lockfile.unlink()
+        except OSError:
+            return True
+    return False
+
+
+def setup_edge_driver(headless=False, fresh_profile=False):
     """
     Set up Microsoft Edge WebDriver.
     
     Args:
         headless: Whether to run browser in headless mode
+        fresh_profile: Use a throwaway profile instead of PROFILE_DIR
+            (e.g. on CI). A throwaway profile is also used when another
+            run is using PROFILE_DIR
         
     Returns:
         WebDriver instance
     """
     print("Setting up Microsoft Edge driver...")
     
+    if not fresh_profile and _profile_in_use():
+        print("Edge profile is in use by another run, using a temporary profile")
+        fresh_profile = True
+    
     edge_options = Options()
     if headless:
         edge_options.add_argument('--headless')
@@ -88,23 +345,32 @@ def setup_edge_driver(headless=False):
     edge_options.add_argument('--disable-dev-shm-usage')
     edge_options.add_argument('--window-size=1920,1080')
     edge_options.add_argument('--disable-blink-features=AutomationControlled')
+    if not fresh_profile:
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        edge_options.add_argument(f'--user-data-dir={PROFILE_DIR}')
+        edge_options.add_argument('--profile-directory=Default')
     
     # Suppress logging
     edge_options.add_experimental_option('excludeSwitches', ['enable-logging'])
     edge_options.add_experimental_option('useAutomationExtension', False)
     
     try:
-        # Try to use webdriver-manager first
+        # Try the cached / webdriver-manager driver first
         try:
-            service = Service(EdgeChromiumDriverManager().install())
+            service = Service(_resolve_driver_path())
             driver = webdriver.Edge(service=service, options=edge_options)
         except:
             # Fall back to system Edge driver
             print("Trying system Edge driver...")
             driver = webdriver.Edge(options=edge_options)
         
+        _enlarge_connection_pool(driver)
         return driver
     except Exception as e:
+        if not fresh_profile and 'already in use' in str(e):
+            # Another run took the profile after the check above
+            print("Edge profile is in use by another run, using a temporary profile")
+            return setup_edge_driver(headless=headless, fresh_profile=True)
         print(f"Error setting up Edge driver: {e}")
         print("\nPlease ensure Microsoft Edge is installed.")
         print("You may need to download msedgedriver.exe manually:")
@@ -112,137 +378,590 @@ def setup_edge_driver(headless=False):
         sys.exit(1)
 
 
-def translate_with_google(text, source_lang='auto', target_lang='en', headless=False, wait_time=10):
+def attach_edge_driver(executor_url, session_id):
+    """
+    Reattach to an Edge browser that is already running.
+    
+    Useful while iterating on a script: the browser (and its Google
+    Translate tab) stays open between runs, so neither the launch nor the
+    page load is paid again. The session id and executor URL come from
+    the WebDriver that started the browser (driver.session_id and
+    driver.command_executor._url).
+    
+    Args:
+        executor_url: URL of the running msedgedriver (e.g. http://127.0.0.1:9515)
+        session_id: WebDriver session id to reuse
+    
+    Returns:
+        WebDriver instance
+    """
+    print(f"Attaching to Edge session {session_id} at {executor_url}...")
+    
+    # Remote() always starts a new session, so point it at the existing
+    # one instead while the driver is being constructed
+    start_session = RemoteWebDriver.start_session
+    
+    def reuse_session(self, *args, **kwargs):
+        self.session_id = session_id
+        self.caps = {}
+    
+    RemoteWebDriver.start_session = reuse_session
+    try:
+        driver = webdriver.Remote(command_executor=executor_url, options=Options())
+    finally:
+        RemoteWebDriver.start_session = start_session
+    
+    _enlarge_connection_pool(driver)
+    return driver
+
+
+def _shows_languages(url, source_lang, target_lang):
+    """Whether url is a Google Translate page for the given language pair."""
+    parts = urlsplit(url)
+    if parts.netloc != 'translate.google.com':
+        return False
+    query = parse_qs(parts.query)
+    return query.get('sl') == [source_lang] and query.get('tl') == [target_lang]
+
+
+def _chunk_text(text, max_chars=4500):
+    """
+    Split text into chunks that fit in the Google Translate input box.
+    
+    Paragraphs (separated by blank lines) are packed greedily into chunks
+    of at most max_chars. A paragraph that is too long on its own is split
+    at line breaks (a transcript has one segment per line), so lines are
+    kept whole; only a single line that is still too long is split into
+    sentences, and a sentence that is still too long is cut hard.
+    
+    Args:
+        text: Text to split
+        max_chars: Maximum characters per chunk
+    
+    Returns:
+        list: Chunks of at most max_chars characters, in order
+    """
+    return list(_pack_chunks(_split_paragraphs(text.split('\n\n'), max_chars), max_chars))
+
+
+def _pack_chunks(pieces, max_chars):
+    """
+    Greedily pack pieces into chunks (generator behind _chunk_text).
+    
+    Args:
+        pieces: Iterable of (separator, piece) pairs, as yielded by
+            _split_paragraphs() or _iter_pieces()
+        max_chars: Maximum characters per chunk
+    
+    Yields:
+        str: Chunks of at most max_chars characters, in order
+    """
+    current = ''
+    for separator, piece in pieces:
+        if current and len(current) + len(separator) + len(piece) <= max_chars:
+            current += separator + piece
+        else:
+            if current:
+                yield current
+            current = piece
+    if current:
+        yield current
+
+
+def _split_paragraphs(paragraphs, max_chars):
+    """Yield (separator, piece) pairs, splitting paragraphs longer than max_chars."""
+    for paragraph in paragraphs:
+        if len(paragraph) <= max_chars:
+            yield '\n\n', paragraph
+            continue
+        separator = '\n\n'
+        for line in paragraph.split('\n'):
+            yield from _split_line(separator, line, max_chars)
+            separator = '\n'
+
+
+def _split_line(separator, line, max_chars):
+    """Yield (separator, piece) pairs for one line, splitting it only if it is longer than max_chars."""
+    if len(line) <= max_chars:
+        yield separator, line
+        return
+    for k, sentence in enumerate(re.split(r'(?<=[.!?])\s+', line)):
+        if k:
+            separator = ' '
+        while len(sentence) > max_chars:
+            yield separator, sentence[:max_chars]
+            sentence = sentence[max_chars:]
+            separator = ''
+        yield separator, sentence
+
+
+def _iter_pieces(lines, max_chars):
+    """
+    Yield the same (separator, piece) pairs as _split_paragraphs() from an
+    iterable of lines.
+    
+    A paragraph is only buffered while it still fits in max_chars; once it
+    is longer, its lines are passed on one at a time, so a transcript with
+    no blank lines is not read into memory as a single paragraph.
+    """
+    current = []        # lines of the paragraph, while it fits in max_chars
+    length = 0
+    separator = None    # separator of the next line once the paragraph is too long
+    line = ''
+    for line in lines:
+        if line == '\n' and (current or separator is not None):
+            # A blank line ends the paragraph
+            if separator is None:
+                yield '\n\n', ''.join(current)[:-1]
+            current, length, separator = [], 0, None
+        elif separator is not None:
+            yield from _split_line(separator, line.removesuffix('\n'), max_chars)
+            separator = '\n'
+        else:
+            current.append(line)
+            length += len(line)
+            if length - 1 > max_chars:
+                # Too long even if it ended here: pass on the lines so far
+                separator = '\n\n'
+                for buffered in current:
+                    yield from _split_line(separator, buffered.removesuffix('\n'), max_chars)
+                    separator = '\n'
+                current, length = [], 0
+    if separator is None:
+        yield from _split_paragraphs([''.join(current)], max_chars)
+    elif line.endswith('\n'):
+        yield separator, ''
+
+
+def iter_chunks(path, max_chars=4500):
+    """
+    Read a text file lazily and yield translation chunks.
+    
+    Same packing as _chunk_text(), but the file is read line by line so
+    only about one chunk (plus the line being read) is held in memory at
+    a time, even for a transcript without blank lines.
+    
+    Args:
+        path: Path to a UTF-8 text file
+        max_chars: Maximum characters per chunk
+    
+    Yields:
+        str: Non-empty chunks with surrounding whitespace stripped
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for chunk in _pack_chunks(_iter_pieces(f, max_chars), max_chars):
+            chunk = chunk.strip()
+            if chunk:
+                yield chunk
+
+
+# Page elements, each as one compound CSS selector so a single wait matches
+# whichever variant the current Google Translate layout uses
+SOURCE_TEXTAREA_SELECTOR = (
+    "textarea[aria-label*='Source text'], "
+    "textarea[aria-label*='Văn bản nguồn'], "
+    "textarea.er8xn, "
+    "textarea[jsname]"
+)
+# Elements that hold the translated text on the target side; Google puts
+# each sentence in its own span, so the text is read from the smallest
+# element inside the result container that contains all of them. Without
+# a result container the sentence texts are joined in page order instead,
+# so the text of the rest of the page is never read.
+TRANSLATION_SELECTOR = "span[jsname='W297wb'], span.ryNqvb, div.J0lOec span"
+TRANSLATION_CONTAINER_SELECTOR = "div.J0lOec"
+TRANSLATION_TEXT_SCRIPT = (
+    "const spans = Array.from(document.querySelectorAll(arguments[0]));"
+    "if (!spans.length) return '';"
+    "const container = spans[0].closest(arguments[1]);"
+    "if (!container) return spans"
+    "  .filter(span => !spans.some(other => other !== span && other.contains(span)))"
+    "  .map(span => span.textContent).join('');"
+    "const inside = spans.filter(span => container.contains(span));"
+    "let box = spans[0];"
+    "while (!inside.every(span => box.contains(span))) box = box.parentElement;"
+    "return box.innerText;"
+)
+# Copy buttons on the target side (clipboard fallback)
+COPY_BUTTON_SELECTOR = (
+    "button[aria-label*='Copy translation'], "
+    "button[aria-label*='Sao chép bản dịch']"
+)
+
+
+def _find_source_textarea(wait):
+    """Locate the Google Translate source text area."""
+    try:
+        return wait.until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, SOURCE_TEXTAREA_SELECTOR))
+        )
+    except TimeoutException:
+        raise Exception("Could not find source text input")
+
+
+def _current_translation(driver):
+    """Return the whole translation currently shown on the page (empty if none)."""
+    # innerText of the element holding every sentence span keeps the
+    # sentences in page order, with the line breaks between paragraphs
+    script_args = (TRANSLATION_SELECTOR, TRANSLATION_CONTAINER_SELECTOR)
+    return (driver.execute_script(TRANSLATION_TEXT_SCRIPT, *script_args) or "").strip()
+
+
+def _copy_translation(driver):
+    """
+    Read the translation through the copy button and the clipboard.
+    
+    Fallback for when the translation cannot be read from the page.
+    
+    Returns:
+        str: Translated text (empty if the clipboard cannot be used)
+    """
+    if pyperclip is None:
+        return ""
+    try:
+        driver.find_element(By.CSS_SELECTOR, COPY_BUTTON_SELECTOR).click()
+    except NoSuchElementException:
+        return ""
+    time.sleep(1)
+    return (pyperclip.paste() or "").strip()
+
+
+class translation_ready:
+    """
+    Wait condition: the translation of the entered text is complete.
+    
+    Used with WebDriverWait, which polls every 500 ms, so the wait ends as
+    soon as Google has rendered the result instead of after a fixed sleep.
+    Long texts are rendered sentence by sentence, so the translation only
+    counts once it is the same on two polls in a row.
+    
+    Args:
+        source_text: Text that was entered (an echo of it is not a result)
+        stale_text: Translation shown before the text was entered
+    """
+    
+    def __init__(self, source_text, stale_text=""):
+        self.source_text = source_text
+        self.stale_text = stale_text
+        self.last_text = None
+    
+    def __call__(self, driver):
+        text = _current_translation(driver)
+        previous, self.last_text = self.last_text, text
+        if text and text != self.source_text and text != self.stale_text and text == previous:
+            return text
+        return False
+
+
+# Sets the text area in one WebDriver command and fires the event Google listens for
+SET_TEXT_SCRIPT = (
+    "arguments[0].value = arguments[1];"
+    "arguments[0].dispatchEvent(new Event('input', {bubbles: true}));"
+)
+
+
+def _paste_text(source_textarea, text):
+    """Enter text through the clipboard with a single paste keystroke."""
+    source_textarea.clear()
+    if pyperclip is None:
+        # No clipboard access - type the text instead (slow for long text)
+        source_textarea.send_keys(text)
+        return
+    modifier = Keys.COMMAND if sys.platform == 'darwin' else Keys.CONTROL
+    pyperclip.copy(text)
+    source_textarea.send_keys(modifier, 'v')
+
+
+def _translate_chunk(driver, wait, source_textarea, text):
     """
-    Translate text using Google Translate web interface.
+    Translate one chunk on an already opened Google Translate page.
     
     Args:
+        driver: WebDriver instance showing translate.google.com
+        wait: WebDriverWait bound to driver
+        source_textarea: Source text area element
         text: Text to translate
+    
+    Returns:
+        str: Translated text
+    """
+    # Replace the text in one command (send_keys costs a round-trip per character)
+    print("Entering text to translate...")
+    stale_text = _current_translation(driver)
+    driver.execute_script(SET_TEXT_SCRIPT, source_textarea, text)
+    
+    # Wait for translation to appear (wait_time is the upper bound); the
+    # wait returns the translated text read straight from the page, so no
+    # copy button or clipboard round-trip is needed
+    print("Waiting for translation...")
+    try:
+        translated_text = wait.until(translation_ready(text, stale_text))
+    except TimeoutException:
+        # Google ignored the scripted input - paste the text instead
+        print("No translation yet, pasting text instead...")
+        _paste_text(source_textarea, text)
+        try:
+            translated_text = wait.until(translation_ready(text, stale_text))
+        except TimeoutException:
+            # Page layout not recognised - fall back to the copy button
+            print("Translation not found on the page, trying the copy button...")
+            translated_text = _copy_translation(driver)
+            if not translated_text or translated_text == text:
+                raise
+    
+    print("✓ Translation retrieved successfully")
+    return translated_text
+
+
+def translate_via_http(text, source_lang='auto', target_lang='en', timeout=10):
+    """
+    Translate text with Google Translate's free JSON endpoint.
+    
+    One HTTP request replaces the browser launch, page load and clipboard
+    round-trip of the Selenium path. The text goes in a POST form body: a
+    4500-character chunk is far too long for a GET URL once non-ASCII
+    characters are percent-encoded.
+    
+    Args:
+        text: Text to translate (at most ~5000 characters)
         source_lang: Source language code (default: auto-detect)
         target_lang: Target language code
-        headless: Run browser in headless mode
-        wait_time: Maximum wait time for elements (seconds)
-        
+        timeout: Request timeout in seconds
+    
     Returns:
         str: Translated text
+    
+    Raises:
+        requests.RequestException: Network error or HTTP error (e.g. 429)
+        ValueError: Unexpected response format
     """
-    driver = None
+    response = requests.post(
+        HTTP_TRANSLATE_URL,
+        params={'client': 'gtx', 'sl': source_lang, 'tl': target_lang, 'dt': 't'},
+        data={'q': text},
+        headers={'User-Agent': 'Mozilla/5.0'},
+        timeout=timeout
+    )
+    response.raise_for_status()
+    
     try:
-        # Setup driver
-        driver = setup_edge_driver(headless=headless)
+        segments = response.json()[0]
+        translated_text = "".join(segment[0] for segment in segments if segment[0])
+    except (IndexError, TypeError) as e:
+        raise ValueError(f"Unexpected response from translate endpoint: {e}")
+    
+    if not translated_text:
+        raise ValueError("Empty translation from translate endpoint")
+    
+    return translated_text
+
+
+def _translate_one(text, source_lang, target_lang, retries=4):
+    """
+    Translate one chunk over HTTP, backing off exponentially on HTTP 429.
+    
+    Args:
+        text: Text to translate
+        source_lang: Source language code
+        target_lang: Target language code
+        retries: Retries after a rate-limited request (waits 1, 2, 4, ... s)
+    
+    Returns:
+        str: Translated text
+    """
+    for attempt in range(retries + 1):
+        try:
+            return translate_via_http(text, source_lang, target_lang)
+        except requests.HTTPError as e:
+            rate_limited = e.response is not None and e.response.status_code == 429
+            if not rate_limited or attempt == retries:
+                raise
+            time.sleep(2 ** attempt)
+
+
+class GoogleTranslator:
+    """
+    Google Translate session that keeps one Edge browser open.
+    
+    The browser is started lazily on the first translation and reused for
+    every later one, so N translations cost a single browser launch. The
+    page is only reloaded when the language pair changes or after an
+    error. Use as a context manager so the browser is closed at the end:
+    
+        with GoogleTranslator(headless=True) as translator:
+            translator.translate("Xin chào", "vi", "en")
+    """
+    
+    def __init__(self, headless=False, wait_time=10, attach=None, fresh_profile=False):
+        """
+        Args:
+            headless: Run browser in headless mode
+            wait_time: Maximum wait time for elements (seconds)
+            attach: Optional (executor_url, session_id) of a running
+                browser to reuse instead of launching one. It is left
+                open when the translator is closed
+            fresh_profile: Launch with a throwaway browser profile
+        """
+        self.headless = headless
+        self.wait_time = wait_time
+        self.attach = attach
+        self.fresh_profile = fresh_profile
+        self.driver = None
+        self._wait = None
+        self._source_textarea = None
+        self._languages = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Quit the browser if it was started."""
+        if self.driver and not self.attach:
+            self.driver.quit()
+        self.driver = None
+        self._languages = None
+    
+    def _open(self, source_lang, target_lang):
+        """Start the browser if needed and show the page for a language pair."""
+        if self.driver is None:
+            if self.attach:
+                self.driver = attach_edge_driver(*self.attach)
+            else:
+                self.driver = setup_edge_driver(headless=self.headless, fresh_profile=self.fresh_profile)
+            self._wait = WebDriverWait(self.driver, self.wait_time)
         
-        # Build Google Translate URL
-        url = f"https://translate.google.com/?sl={source_lang}&tl={target_lang}&op=translate"
-        print(f"\nOpening Google Translate ({source_lang} → {target_lang})...")
-        driver.get(url)
+        if self._languages != (source_lang, target_lang):
+            # An attached browser may already show the right page
+            if self.attach and _shows_languages(self.driver.current_url, source_lang, target_lang):
+                print(f"\nReusing open Google Translate tab ({source_lang} → {target_lang})")
+            else:
+                # Build Google Translate URL
+                url = f"https://translate.google.com/?sl={source_lang}&tl={target_lang}&op=translate"
+                print(f"\nOpening Google Translate ({source_lang} → {target_lang})...")
+                self.driver.get(url)
+            self._source_textarea = _find_source_textarea(self._wait)
+            self._languages = (source_lang, target_lang)
+    
+    def translate(self, text, source_lang='auto', target_lang='en'):
+        """
+        Translate text in the shared browser session.
         
-        # Wait for page to load
-        wait = WebDriverWait(driver, wait_time)
+        Args:
+            text: Text to translate
+            source_lang: Source language code (default: auto-detect)
+            target_lang: Target language code
         
-        # Find and fill source text area
-        print("Entering text to translate...")
+        Returns:
+            str: Translated text
+        """
         try:
-            # Try multiple possible selectors for the input textarea
-            source_textarea = None
-            selectors = [
-                "textarea[aria-label*='Source text']",
-                "textarea[aria-label*='Văn bản nguồn']",
-                "textarea.er8xn",
-                "textarea[jsname]",
-            ]
-            
-            for selector in selectors:
-                try:
-                    source_textarea = wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    break
-                except:
-                    continue
-            
-            if not source_textarea:
-                raise Exception("Could not find source text input")
-            
-            # Clear and enter text
-            source_textarea.clear()
-            source_textarea.send_keys(text)
-            
-            # Wait for translation to appear
-            print("Waiting for translation...")
-            time.sleep(3)  # Give it time to translate
-            
-            # Find the copy button on the target side
-            print("Looking for copy button...")
-            copy_button = None
-            copy_selectors = [
-                "button[aria-label*='Copy translation']",
-                "button[aria-label*='Sao chép bản dịch']",
-                "button.VfPpkd-Bz112c-LgbsSe.yHy1rc.eT1oJ.mN1ivc.YJBIwf",
-                "button[jsname='W297wb']",
-            ]
-            
-            for selector in copy_selectors:
-                try:
-                    copy_button = wait.until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    break
-                except:
-                    continue
-            
-            if not copy_button:
-                # Try to get translation text directly
-                print("Copy button not found, trying to get text directly...")
-                translation_selectors = [
-                    "span[jsname='W297wb']",
-                    "span.ryNqvb",
-                    "div.J0lOec span",
-                ]
-                
-                for selector in translation_selectors:
-                    try:
-                        translation_element = driver.find_element(By.CSS_SELECTOR, selector)
-                        translated_text = translation_element.text
-                        if translated_text and translated_text != text:
-                            print("✓ Translation retrieved directly")
-                            return translated_text
-                    except:
-                        continue
-                
-                raise Exception("Could not find translation or copy button")
-            
-            # Click copy button
-            print("Clicking copy button...")
-            copy_button.click()
-            time.sleep(1)
-            
-            # Get text from clipboard
-            print("Getting text from clipboard...")
-            translated_text = pyperclip.paste()
-            
-            if not translated_text or translated_text == text:
-                raise Exception("Translation appears to be empty or same as input")
-            
-            print("✓ Translation copied successfully")
-            return translated_text
+            self._open(source_lang, target_lang)
+            return _translate_chunk(self.driver, self._wait, self._source_textarea, text)
             
         except TimeoutException:
             print("Timeout waiting for page elements")
+            self._languages = None
             raise
         except Exception as e:
             print(f"Error during translation: {e}")
+            self._languages = None
             # Take screenshot for debugging
-            screenshot_path = "error_screenshot.png"
-            driver.save_screenshot(screenshot_path)
-            print(f"Screenshot saved to: {screenshot_path}")
+            if self.driver:
+                screenshot_path = "error_screenshot.png"
+                self.driver.save_screenshot(screenshot_path)
+                print(f"Screenshot saved to: {screenshot_path}")
             raise
-            
-    finally:
-        if driver:
-            driver.quit()
 
 
-def process_file(input_file, target_lang='en', source_lang='auto', output_file=None, headless=False):
+def translate_with_google(
+    text,
+    source_lang='auto',
+    target_lang='en',
+    headless=False,
+    wait_time=10,
+    use_cache=True,
+    translator=None,
+    use_http=True,
+    workers=8,
+    fresh_profile=False
+):
+    """
+    Translate text with Google Translate, reusing cached results.
+    
+    The cache is checked per chunk before any browser is started, so
+    repeated requests return immediately and partially changed documents
+    only send the chunks that changed. Remaining chunks go to the HTTP
+    endpoint first, several requests in parallel; chunks it cannot
+    translate (network error, persistent rate limit) are translated in a
+    single browser session instead.
+    
+    Args:
+        text: Text to translate, or a list of chunks from _chunk_text()
+        source_lang: Source language code (default: auto-detect)
+        target_lang: Target language code
+        headless: Run browser in headless mode
+        wait_time: Maximum wait time for elements (seconds)
+        use_cache: Read and write the persistent translation cache
+        translator: Open GoogleTranslator to reuse. If None, a browser is
+            started for this call and closed afterwards
+        use_http: Try translate_via_http() before the browser
+        workers: Parallel HTTP requests
+        fresh_profile: Launch the browser with a throwaway profile (only
+            used when no translator is given)
+    
+    Returns:
+        str: Translated text (chunks joined with blank lines)
+    """
+    chunks = [text] if isinstance(text, str) else list(text)
+    translations = [None] * len(chunks)
+    
+    if use_cache:
+        for i, chunk in enumerate(chunks):
+            translations[i] = get_cached_translation(chunk, source_lang, target_lang)
+        hits = sum(translation is not None for translation in translations)
+        if hits:
+            print(f"✓ {hits}/{len(chunks)} chunk(s) found in cache")
+    
+    missing = [i for i, translation in enumerate(translations) if translation is None]
+    if missing and use_http:
+        print(f"Translating {len(missing)} chunk(s) via HTTP endpoint...")
+        failed = []
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(missing)))) as executor:
+            futures = {
+                i: executor.submit(_translate_one, chunks[i], source_lang, target_lang)
+                for i in missing
+            }
+            for i, future in futures.items():
+                try:
+                    translations[i] = future.result()
+                except (requests.RequestException, ValueError) as e:
+                    print(f"⚠ HTTP translation of chunk {i + 1} failed: {e}")
+                    failed.append(i)
+                    continue
+                if use_cache:
+                    cache_translation(chunks[i], source_lang, target_lang, translations[i])
+        missing = failed
+        if missing:
+            print(f"Falling back to browser for {len(missing)} chunk(s)")
+    
+    if missing:
+        with (contextlib.nullcontext(translator) if translator is not None
+              else GoogleTranslator(headless=headless, wait_time=wait_time, fresh_profile=fresh_profile)) as session:
+            for number, i in enumerate(missing, 1):
+                if len(missing) > 1:
+                    print(f"\nChunk {number}/{len(missing)} ({len(chunks[i])} characters)")
+                translations[i] = session.translate(chunks[i], source_lang, target_lang)
+                if use_cache:
+                    cache_translation(chunks[i], source_lang, target_lang, translations[i])
+    
+    return "\n\n".join(translations)
+
+
+def process_file(input_file, target_lang='en', source_lang='auto', output_file=None, headless=False, use_cache=None,
+                 use_http=True, workers=8, attach=None, fresh_profile=False):
     """
     Process a file through Google Translate automation.
     
@@ -252,6 +971,13 @@ def process_file(input_file, target_lang='en', source_lang='auto', output_file=N
         source_lang: Source language (auto-detect if not specified)
         output_file: Path to output file (optional)
         headless: Run browser in headless mode
+        use_cache: Reuse and store translations in CACHE_PATH. If None, only
+            for *_sanitized files, since the cache keeps translations as
+            plain text for CACHE_TTL
+        use_http: Try the HTTP endpoint before launching the browser
+        workers: Parallel HTTP requests
+        attach: Optional (executor_url, session_id) of a running browser to reuse
+        fresh_profile: Launch the browser with a throwaway profile
     """
     print("=" * 60)
     print("GOOGLE TRANSLATE AUTOMATION")
@@ -264,36 +990,24 @@ def process_file(input_file, target_lang='en', source_lang='auto', output_file=N
         sys.exit(1)
     
     print(f"\nReading: {input_file}")
-    with open(input_path, 'r', encoding='utf-8') as f:
-        text = f.read().strip()
     
-    if not text:
+    if use_cache is None:
+        use_cache = input_path.stem.endswith('_sanitized')
+        if not use_cache:
+            print("Translation cache: off (not a *_sanitized file; use --cache to enable)")
+    
+    # Google Translate truncates long input, so the file is read lazily in
+    # chunks of up to 4500 characters
+    chunks = iter_chunks(input_path)
+    first_batch = list(itertools.islice(chunks, max(1, workers)))
+    if not first_batch:
         print("Error: Input file is empty")
         sys.exit(1)
     
-    print(f"Text length: {len(text)} characters")
-    
-    # Warn if text is very long
-    if len(text) > 5000:
-        print("\n⚠ Warning: Text is quite long. Google Translate may have character limits.")
-        print("Consider splitting into smaller chunks if translation fails.")
-    
     # Convert language names to codes
     source_code = get_language_code(source_lang)
     target_code = get_language_code(target_lang)
     
-    # Perform translation
-    try:
-        translated_text = translate_with_google(
-            text, 
-            source_lang=source_code,
-            target_lang=target_code,
-            headless=headless
-        )
-    except Exception as e:
-        print(f"\n❌ Translation failed: {e}")
-        sys.exit(1)
-    
     # Determine output file path
     if not output_file:
         # Create output filename with _autotranslated.txt suffix
@@ -302,16 +1016,47 @@ def process_file(input_file, target_lang='en', source_lang='auto', output_file=N
     else:
         output_file = Path(output_file)
     
-    # Save translated text
-    print(f"\nSaving translation to: {output_file}")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(translated_text)
+    # Translate batch by batch, writing each result as soon as it is ready
+    # (the browser is only launched if a chunk is not cached). The batches
+    # go to a .part file that only replaces the output once every chunk is
+    # translated, so a failure never leaves a truncated translation behind.
+    print(f"Saving translation to: {output_file}")
+    partial_file = output_file.with_name(output_file.name + '.part')
+    source_length = 0
+    translated_length = 0
+    try:
+        with GoogleTranslator(headless=headless, attach=attach, fresh_profile=fresh_profile) as translator, \
+                open(partial_file, 'w', encoding='utf-8') as f:
+            batch = first_batch
+            while batch:
+                translated_text = translate_with_google(
+                    batch,
+                    source_lang=source_code,
+                    target_lang=target_code,
+                    use_cache=use_cache,
+                    translator=translator,
+                    use_http=use_http,
+                    workers=workers
+                )
+                if translated_length:
+                    f.write("\n\n")
+                    translated_length += 2
+                f.write(translated_text)
+                source_length += sum(len(chunk) for chunk in batch)
+                translated_length += len(translated_text)
+                batch = list(itertools.islice(chunks, max(1, workers)))
+        os.replace(partial_file, output_file)
+    except Exception as e:
+        partial_file.unlink(missing_ok=True)
+        print(f"\n❌ Translation failed: {e}")
+        sys.exit(1)
     
     print("\n" + "=" * 60)
     print("TRANSLATION COMPLETE")
     print("=" * 60)
     print(f"\n✓ Output file: {output_file}")
-    print(f"✓ Translation length: {len(translated_text)} characters")
+    print(f"✓ Text length: {source_length} characters")
+    print(f"✓ Translation length: {translated_length} characters")
 
 
 def main():
@@ -331,12 +1076,25 @@ Examples:
   
   # Run in headless mode (no browser window)
   python auto_translate_google.py input.txt --target-lang English --headless
+  
+  # Force a fresh translation instead of using the cache
+  python auto_translate_google.py input_sanitized.txt --target-lang English --no-cache
+  
+  # Reuse an Edge window that is already open (development)
+  python auto_translate_google.py input.txt --target-lang English --browser \\
+      --executor http://127.0.0.1:9515 --attach-session SESSION_ID
 
 Supported languages:
   English, Vietnamese, Spanish, French, German, Chinese, Japanese, 
   Korean, Thai, Russian, Portuguese, Italian, Arabic, Hindi
   
   You can also use language codes: en, vi, es, fr, de, zh-CN, ja, ko, etc.
+
+Translation cache:
+  Translations of *_sanitized files are kept for 30 days in
+  ~/.cache/video2text/google_translate.sqlite, keyed by a SHA-256 of the
+  source text. The source text is not stored, but the translations are,
+  as plain text. Other files are not cached unless --cache is given.
         """
     )
     
@@ -349,15 +1107,38 @@ Supported languages:
                        help='Output file path (default: input_file_autotranslated.txt)')
     parser.add_argument('--headless', action='store_true',
                        help='Run browser in headless mode (no visible window)')
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument('--cache', dest='use_cache', action='store_const', const=True,
+                             help='Use the translation cache even if the input is not a *_sanitized file')
+    cache_group.add_argument('--no-cache', dest='use_cache', action='store_const', const=False,
+                             help='Ignore and do not update the translation cache')
+    parser.add_argument('--browser', action='store_true',
+                       help='Always use the browser (skip the faster HTTP endpoint)')
+    parser.add_argument('--workers', type=int, default=8,
+                       help='Parallel HTTP translation requests (default: 8)')
+    parser.add_argument('--fresh-profile', action='store_true',
+                       help='Launch Edge with a throwaway profile instead of the cached one')
+    parser.add_argument('--attach-session', metavar='SESSION_ID',
+                       help='Reuse a running Edge WebDriver session instead of launching a browser')
+    parser.add_argument('--executor', metavar='URL',
+                       help='WebDriver URL of the session given with --attach-session')
     
     args = parser.parse_args()
     
+    if bool(args.attach_session) != bool(args.executor):
+        parser.error('--attach-session and --executor must be used together')
+    
     process_file(
         input_file=args.input_file,
         target_lang=args.target_lang,
         source_lang=args.source_lang,
         output_file=args.output,
-        headless=args.headless
+        headless=args.headless,
+        use_cache=args.use_cache,
+        use_http=not args.browser,
+        workers=args.workers,
+        attach=(args.executor, args.attach_session) if args.attach_session else None,
+        fresh_profile=args.fresh_profile
     )
 
 
@@ -8,10 +8,11 @@ This script orchestrates the complete workflow:
 3. Restore confidential information in the summary
 
 Usage:
-    python process_video_complete.py <video_file>
+    python process_video_complete.py <video_file_or_folder> [...]
 
 Example:
     python process_video_complete.py presentation.mp4
+    python process_video_complete.py videos/
 
 Output files:
     - video.txt (original transcription)
@@ -21,32 +22,47 @@ Output files:
 """
 
 import sys
-import os
 import argparse
+import functools
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import subprocess
 
 # Import project modules
 try:
-    from main import transcribe_video, check_gpu_availability
+    from main import (
+        transcribe_video, transcribe_audios, save_transcription,
+        check_gpu_availability, load_audio, load_models
+    )
 except ImportError:
     print("Error: main.py not found in the current directory")
     sys.exit(1)
 
 try:
-    from summarize_with_ollama import summarize_text, check_ollama_service, check_model_available
+    from summarize_with_ollama import (
+        summarize_text, ensure_ollama_ready, OllamaUnavailable, SummaryWriter, read_sanitized_text
+    )
     from translate_with_ollama import translate_text
-    from reverse_sanitize import reverse_sanitize_text, create_reverse_mapping
+    from reverse_sanitize import DEFAULT_MAPPING
 except ImportError:
     print("Error: Required modules (summarize_with_ollama.py, translate_with_ollama.py or reverse_sanitize.py) not found")
     sys.exit(1)
 
 
+# File types picked up when a folder is passed on the command line
+VIDEO_EXTENSIONS = {'.mp4', '.mkv', '.avi', '.mov', '.webm', '.m4a', '.mp3', '.wav'}
+
+# Only one thread at a time may run inference on the GPU
+_GPU_LOCK = threading.Lock()
+
+# Separator line for section headers
+_BAR = "=" * 70
+
+
 def print_section(title):
     """Print a formatted section header."""
-    print("\n" + "="*70)
-    print(f"  {title}")
-    print("="*70 + "\n")
+    print(f"\n{_BAR}\n  {title}\n{_BAR}\n", flush=True)
 
 
 def complete_pipeline(
@@ -57,7 +73,9 @@ def complete_pipeline(
     skip_summary=False,
     keep_sanitized=False,
     translate_to=None,
-    translate_source=None
+    translate_source=None,
+    recheck_ollama=False,
+    sequential=False
 ):
     """
     Execute the complete video processing pipeline.
@@ -71,6 +89,8 @@ def complete_pipeline(
         keep_sanitized: Keep summary/translation sanitized
         translate_to: Target language for translation (None = no translation)
         translate_source: Source language for translation
+        recheck_ollama: Probe Ollama again instead of reusing earlier checks
+        sequential: Summarize and translate one after the other instead of concurrently
         
     Returns:
         dict: Paths to all generated files
@@ -85,150 +105,346 @@ def complete_pipeline(
     
     # STEP 1: Transcribe video
     print_section("STEP 1: VIDEO TRANSCRIPTION")
+    device = check_gpu_availability()
     print(f"Video file: {video_path.name}")
-    print(f"Device: {check_gpu_availability()}")
+    print(f"Device: {device}")
     
     try:
-        original_txt, sanitized_txt = transcribe_video(str(video_path))
+        # Decode once here and hand the samples to the transcriber
+        audio = load_audio(str(video_path))
+        with _GPU_LOCK:
+            original_txt, sanitized_txt = transcribe_video(str(video_path), audio=audio, device=device)
         results['transcription_original'] = original_txt
         results['transcription_sanitized'] = sanitized_txt
+        sanitized_name = Path(sanitized_txt).name
         print(f"\n✓ Original transcription: {Path(original_txt).name}")
-        print(f"✓ Sanitized transcription: {Path(sanitized_txt).name}")
+        print(f"✓ Sanitized transcription: {sanitized_name}")
     except Exception as e:
         print(f"Error during transcription: {e}")
         return None
     
-    # STEP 2: Summarize sanitized text
-    if not skip_summary:
-        print_section("STEP 2: OLLAMA SUMMARIZATION")
-        
-        # Check Ollama
-        if not check_ollama_service():
-            print("Warning: Ollama not available, skipping summarization")
-            skip_summary = True
-        elif not check_model_available(model):
-            print(f"Warning: Model {model} not available, skipping summarization")
-            skip_summary = True
+    results.update(post_process(
+        video_path,
+        sanitized_txt,
+        model=model,
+        custom_prompt=custom_prompt,
+        max_summary_length=max_summary_length,
+        skip_summary=skip_summary,
+        keep_sanitized=keep_sanitized,
+        translate_to=translate_to,
+        translate_source=translate_source,
+        recheck_ollama=recheck_ollama,
+        sequential=sequential
+    ))
+    
+    return results
+
+
+def post_process(
+    video_path,
+    sanitized_txt,
+    model="llama3.2",
+    custom_prompt=None,
+    max_summary_length=None,
+    skip_summary=False,
+    keep_sanitized=False,
+    translate_to=None,
+    translate_source=None,
+    recheck_ollama=False,
+    sequential=False
+):
+    """
+    Summarize, translate and restore an existing sanitized transcription.
+    
+    These steps only talk to Ollama, so they can run on a worker thread
+    while the GPU transcribes the next video.
+    
+    Args:
+        video_path: Path to the source video (used to name the outputs)
+        sanitized_txt: Path to the sanitized transcription
+        model: Ollama model for summarization/translation
+        custom_prompt: Custom prompt for Ollama
+        max_summary_length: Maximum summary length in words
+        skip_summary: Skip summarization step
+        keep_sanitized: Keep summary/translation sanitized
+        translate_to: Target language for translation (None = no translation)
+        translate_source: Source language for translation
+        recheck_ollama: Probe Ollama again instead of reusing earlier checks
+        sequential: Summarize and translate one after the other instead of concurrently
+    
+    Returns:
+        dict: Paths to the generated summary/translation files
+    """
+    video_path = Path(video_path)
+    base_name = video_path.stem
+    out_dir = video_path.parent
+    
+    results = {}
+    if skip_summary and not translate_to:
+        return results
+    
+    # Check Ollama once for both steps (the outcome is cached for the run)
+    try:
+        ensure_ollama_ready(model, recheck=recheck_ollama)
+    except OllamaUnavailable as e:
+        print(f"Warning: {e}, skipping summarization/translation")
+        return results
+    
+    # Read sanitized text once; both steps share the same string
+    sanitized_name = Path(sanitized_txt).name
+    try:
+        sanitized_content = read_sanitized_text(sanitized_txt)
+    except OSError as e:
+        print(f"Error reading {sanitized_name}: {e}")
+        return results
+    
+    # Both restores share the reverse mapping built at import
+    mapping = None if keep_sanitized else DEFAULT_MAPPING
     
+    steps = []
     if not skip_summary:
-        try:
-            # Read sanitized text
-            with open(sanitized_txt, 'r', encoding='utf-8') as f:
-                sanitized_content = f.read()
-            
-            print(f"Input: {Path(sanitized_txt).name} ({len(sanitized_content)} chars)")
-            print(f"Model: {model}")
-            
-            # Generate summary
+        steps.append(functools.partial(
+            _summarize_step, sanitized_content, sanitized_name, base_name, out_dir,
+            model, custom_prompt, max_summary_length, keep_sanitized, mapping
+        ))
+    if translate_to:
+        steps.append(functools.partial(
+            _translate_step, sanitized_content, sanitized_name, base_name, out_dir,
+            model, translate_to, translate_source, keep_sanitized, mapping
+        ))
+    
+    # Summary and translation only share the (read-only) input, so they can
+    # run side by side; set OLLAMA_NUM_PARALLEL so Ollama serves both at once
+    if sequential or len(steps) == 1:
+        for step in steps:
+            results.update(step())
+    else:
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            for future in [executor.submit(step) for step in steps]:
+                results.update(future.result())
+    
+    return results
+
+
+def _summarize_step(sanitized_content, sanitized_name, base_name, out_dir, model, custom_prompt, max_summary_length,
+                    keep_sanitized, mapping=None):
+    """
+    Summarize a sanitized transcription and restore the summary.
+    
+    Returns:
+        dict: Paths to the generated summary files
+    """
+    results = {}
+    print_section("STEP 2: OLLAMA SUMMARIZATION")
+    
+    try:
+        print(f"Input: {sanitized_name} ({len(sanitized_content)} chars)")
+        print(f"Model: {model}")
+        
+        summary_sanitized_path = out_dir / f"{base_name}_summary_sanitized.txt"
+        summary_restored_path = None if keep_sanitized else out_dir / f"{base_name}_summary_restored.txt"
+        
+        # Generate summary; the sanitized and restored summaries are written
+        # line by line while it streams in
+        with SummaryWriter(summary_sanitized_path, summary_restored_path, mapping) as writer:
             summary = summarize_text(
                 sanitized_content,
                 model=model,
                 custom_prompt=custom_prompt,
-                max_length=max_summary_length
+                max_length=max_summary_length,
+                stream_to=writer.write
             )
+        
+        if summary is None:
+            writer.discard()
+            print("Warning: Summarization failed")
+            return results
+        
+        results['summary_sanitized'] = str(summary_sanitized_path)
+        print(f"\n✓ Sanitized summary: {summary_sanitized_path.name}")
+        print(f"  Length: {len(summary)} characters")
+        
+        # Confidential information was restored while streaming
+        if summary_restored_path:
+            print_section("STEP 3: RESTORE CONFIDENTIAL INFORMATION (Summary)")
             
-            if summary is None:
-                print("Warning: Summarization failed")
-                skip_summary = True
-            else:
-                # Save sanitized summary
-                base_name = video_path.stem
-                summary_sanitized_path = video_path.parent / f"{base_name}_summary_sanitized.txt"
-                
-                with open(summary_sanitized_path, 'w', encoding='utf-8') as f:
-                    f.write(summary)
-                
-                results['summary_sanitized'] = str(summary_sanitized_path)
-                print(f"\n✓ Sanitized summary: {summary_sanitized_path.name}")
-                print(f"  Length: {len(summary)} characters")
-                
-                # STEP 3: Restore confidential information
-                if not keep_sanitized:
-                    step_num = 4 if translate_to else 3
-                    print_section(f"STEP {step_num}: RESTORE CONFIDENTIAL INFORMATION (Summary)")
-                    
-                    restored_summary = reverse_sanitize_text(summary)
-                    
-                    summary_restored_path = video_path.parent / f"{base_name}_summary_restored.txt"
-                    
-                    with open(summary_restored_path, 'w', encoding='utf-8') as f:
-                        f.write(restored_summary)
-                    
-                    results['summary_restored'] = str(summary_restored_path)
-                    print(f"✓ Restored summary: {summary_restored_path.name}")
-                    print(f"  Confidential information restored")
-                
-        except Exception as e:
-            print(f"Error during summarization: {e}")
-            skip_summary = True
-    
-    # STEP 4 (or 3): Translate sanitized text
-    if translate_to:
-        step_num = 4 if not skip_summary else 3
-        print_section(f"STEP {step_num}: OLLAMA TRANSLATION")
+            results['summary_restored'] = str(summary_restored_path)
+            print(f"✓ Restored summary: {summary_restored_path.name}")
+            print(f"  Confidential information restored")
         
-        # Check Ollama (if not already checked)
-        if skip_summary and not check_ollama_service():
-            print("Warning: Ollama not available, skipping translation")
-            translate_to = None
-        elif skip_summary and not check_model_available(model):
-            print(f"Warning: Model {model} not available, skipping translation")
-            translate_to = None
+    except Exception as e:
+        print(f"Error during summarization: {e}")
     
-    if translate_to:
-        try:
-            # Read sanitized text
-            with open(sanitized_txt, 'r', encoding='utf-8') as f:
-                sanitized_content = f.read()
-            
-            print(f"Input: {Path(sanitized_txt).name}")
-            print(f"Target language: {translate_to}")
-            if translate_source:
-                print(f"Source language: {translate_source}")
-            print(f"Model: {model}")
-            
-            # Generate translation
+    return results
+
+
+def _translate_step(sanitized_content, sanitized_name, base_name, out_dir, model, translate_to, translate_source,
+                    keep_sanitized, mapping=None):
+    """
+    Translate a sanitized transcription and restore the translation.
+    
+    Returns:
+        dict: Paths to the generated translation files
+    """
+    results = {}
+    print_section("STEP 2: OLLAMA TRANSLATION")
+    
+    try:
+        print(f"Input: {sanitized_name}")
+        print(f"Target language: {translate_to}")
+        if translate_source:
+            print(f"Source language: {translate_source}")
+        print(f"Model: {model}")
+        
+        safe_lang = translate_to.lower().replace(' ', '_')
+        translation_sanitized_path = out_dir / f"{base_name}_translation_{safe_lang}_sanitized.txt"
+        translation_restored_path = None if keep_sanitized else out_dir / f"{base_name}_translation_{safe_lang}_restored.txt"
+        
+        # Generate translation; the sanitized and restored translations are
+        # written line by line while it streams in
+        with SummaryWriter(translation_sanitized_path, translation_restored_path, mapping) as writer:
             translation = translate_text(
                 sanitized_content,
                 target_language=translate_to,
                 model=model,
-                source_language=translate_source
+                source_language=translate_source,
+                stream_to=writer.write
             )
+        
+        if translation is None:
+            writer.discard()
+            print("Warning: Translation failed")
+            return results
+        
+        results['translation_sanitized'] = str(translation_sanitized_path)
+        print(f"\n✓ Sanitized translation: {translation_sanitized_path.name}")
+        print(f"  Length: {len(translation)} characters")
+        
+        # Confidential information was restored while streaming
+        if translation_restored_path:
+            print_section("STEP 3: RESTORE CONFIDENTIAL INFORMATION (Translation)")
+            
+            results['translation_restored'] = str(translation_restored_path)
+            print(f"✓ Restored translation: {translation_restored_path.name}")
+            print(f"  Confidential information restored")
+        
+    except Exception as e:
+        print(f"Error during translation: {e}")
+        import traceback
+        traceback.print_exc()
+    
+    return results
+
+
+def collect_videos(paths):
+    """
+    Expand command line paths into a list of video files.
+    
+    Args:
+        paths (list): Video files and/or folders containing videos
+    
+    Returns:
+        list: Video file paths; folders contribute their videos sorted by name
+    """
+    videos = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            videos.extend(sorted(p for p in path.iterdir() if p.suffix.lower() in VIDEO_EXTENSIONS))
+        else:
+            videos.append(path)
+    return videos
+
+
+def process_folder(video_paths, workers=2, **options):
+    """
+    Run the complete pipeline over many videos, overlapping the stages.
+    
+    One thread decodes audio with ffmpeg and feeds a small queue, the
+    calling thread owns the GPU and transcribes whatever has been decoded
+    so far (one video after another), and a thread pool runs the Ollama steps of
+    finished transcripts. Decode and LLM latency hide behind GPU time.
+    
+    Args:
+        video_paths (list): Paths to input video files
+        workers (int, optional): Threads for summarization/translation
+        **options: Keyword arguments passed to post_process()
+    
+    Returns:
+        dict: video path -> paths to all generated files (None on failure)
+    """
+    print_section("LOADING MODELS")
+    device = check_gpu_availability()
+    print(f"Device: {device}")
+    try:
+        asr_model = load_models(device)
+    except Exception as e:
+        print(f"Error loading WhisperX model: {e}")
+        return {str(path): None for path in video_paths}
+    
+    # Bounded so decoded audio does not pile up faster than the GPU consumes it
+    decoded = queue.Queue(maxsize=4)
+    
+    def decode_all():
+        for path in map(Path, video_paths):
+            try:
+                if not path.exists():
+                    raise FileNotFoundError(f"Video file not found: {path}")
+                decoded.put((path, load_audio(str(path))))
+            except Exception as e:
+                print(f"Error decoding {path.name}: {e}")
+                decoded.put((path, None))
+        decoded.put(None)
+    
+    results = {}
+    pending = {}
+    with ThreadPoolExecutor(max_workers=1) as decoder, \
+            ThreadPoolExecutor(max_workers=workers) as post_pool:
+        decoder.submit(decode_all)
+        
+        done = False
+        while not done:
+            # Block for one decoded video, then take whatever else is ready
+            ready = [decoded.get()]
+            while ready[-1] is not None:
+                try:
+                    ready.append(decoded.get_nowait())
+                except queue.Empty:
+                    break
+            if ready[-1] is None:
+                ready.pop()
+                done = True
             
-            if translation is None:
-                print("Warning: Translation failed")
-            else:
-                # Save sanitized translation
-                base_name = video_path.stem
-                safe_lang = translate_to.lower().replace(' ', '_')
-                translation_sanitized_path = video_path.parent / f"{base_name}_translation_{safe_lang}_sanitized.txt"
-                
-                with open(translation_sanitized_path, 'w', encoding='utf-8') as f:
-                    f.write(translation)
-                
-                results['translation_sanitized'] = str(translation_sanitized_path)
-                print(f"\n✓ Sanitized translation: {translation_sanitized_path.name}")
-                print(f"  Length: {len(translation)} characters")
-                
-                # Restore confidential information
-                if not keep_sanitized:
-                    if not skip_summary:
-                        print_section(f"STEP 5: RESTORE CONFIDENTIAL INFORMATION (Translation)")
-                    restored_translation = reverse_sanitize_text(translation)
-                    
-                    translation_restored_path = video_path.parent / f"{base_name}_translation_{safe_lang}_restored.txt"
-                    
-                    with open(translation_restored_path, 'w', encoding='utf-8') as f:
-                        f.write(restored_translation)
-                    
-                    results['translation_restored'] = str(translation_restored_path)
-                    print(f"✓ Restored translation: {translation_restored_path.name}")
-                    print(f"  Confidential information restored")
-                
-        except Exception as e:
-            print(f"Error during translation: {e}")
-            import traceback
-            traceback.print_exc()
+            for path, _ in ready:
+                results[str(path)] = None
+            ready = [(path, audio) for path, audio in ready if audio is not None]
+            if not ready:
+                continue
+            
+            print_section(f"TRANSCRIBING: {', '.join(path.name for path, _ in ready)}")
+            try:
+                with _GPU_LOCK:
+                    transcripts = transcribe_audios(asr_model, [audio for _, audio in ready], device)
+            except Exception as e:
+                print(f"Error during transcription: {e}")
+                continue
+            
+            for (path, _), transcript in zip(ready, transcripts):
+                try:
+                    original_txt, sanitized_txt = save_transcription(transcript, str(path.with_suffix(".txt")))
+                except Exception as e:
+                    print(f"Error saving transcription of {path.name}: {e}")
+                    continue
+                results[str(path)] = {
+                    'transcription_original': original_txt,
+                    'transcription_sanitized': sanitized_txt
+                }
+                pending[str(path)] = post_pool.submit(post_process, path, sanitized_txt, **options)
+        
+        for path, future in pending.items():
+            try:
+                results[path].update(future.result())
+            except Exception as e:
+                print(f"Error post-processing {Path(path).name}: {e}")
     
     return results
 
@@ -248,6 +464,9 @@ Examples:
   # Full pipeline with defaults
   python process_video_complete.py presentation.mp4
   
+  # Every video in a folder (decode, GPU and Ollama work overlap)
+  python process_video_complete.py videos/ --workers 3
+  
   # Use different Ollama model
   python process_video_complete.py meeting.mkv --model llama2
   
@@ -292,7 +511,8 @@ Note on Translation Restoration:
     
     parser.add_argument(
         'video_file',
-        help='Path to video file to process'
+        nargs='+',
+        help='Path to video file(s) or folder(s) of videos to process'
     )
     
     parser.add_argument(
@@ -335,23 +555,75 @@ Note on Translation Restoration:
         help='Source language for translation (optional, auto-detect if not specified)'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=2,
+        help='Parallel Ollama jobs when processing several videos (default: 2)'
+    )
+    
+    parser.add_argument(
+        '--recheck-ollama',
+        action='store_true',
+        help='Check Ollama and the model again for every video instead of once per run'
+    )
+    
+    parser.add_argument(
+        '--sequential',
+        action='store_true',
+        help='Run summarization and translation one after the other (for debugging)'
+    )
+    
     args = parser.parse_args()
+    video_files = collect_videos(args.video_file)
+    if not video_files:
+        parser.error("no video files found")
     
     # Print header
-    print("\n" + "="*70)
-    print("  VIDEO PROCESSING PIPELINE WITH PRIVACY PROTECTION")
-    print("="*70)
+    print(f"\n{_BAR}\n  VIDEO PROCESSING PIPELINE WITH PRIVACY PROTECTION\n{_BAR}", flush=True)
+    
+    # Several videos: overlap decoding, transcription and Ollama work
+    if len(video_files) > 1:
+        all_results = process_folder(
+            video_files,
+            workers=args.workers,
+            model=args.model,
+            custom_prompt=args.prompt,
+            max_summary_length=args.max_length,
+            skip_summary=args.skip_summary,
+            keep_sanitized=args.keep_sanitized,
+            translate_to=args.translate_to,
+            translate_source=args.source_lang,
+            recheck_ollama=args.recheck_ollama,
+            sequential=args.sequential
+        )
+        
+        print_section("PIPELINE COMPLETE")
+        failed = 0
+        for video, results in all_results.items():
+            if not results:
+                failed += 1
+                print(f"✗ {Path(video).name}: failed")
+                continue
+            print(f"✓ {Path(video).name}:")
+            for key, path in results.items():
+                print(f"    {key.replace('_', ' ').title()}: {Path(path).name}")
+        
+        print(f"\n{len(all_results) - failed}/{len(all_results)} videos processed")
+        return 1 if failed else 0
     
     # Execute pipeline
     results = complete_pipeline(
-        args.video_file,
+        video_files[0],
         model=args.model,
         custom_prompt=args.prompt,
         max_summary_length=args.max_length,
         skip_summary=args.skip_summary,
         keep_sanitized=args.keep_sanitized,
         translate_to=args.translate_to,
-        translate_source=args.source_lang
+        translate_source=args.source_lang,
+        recheck_ollama=args.recheck_ollama,
+        sequential=args.sequential
     )
     
     if results:
@@ -361,9 +633,7 @@ Note on Translation Restoration:
         for key, path in results.items():
             print(f"  ✓ {key.replace('_', ' ').title()}: {Path(path).name}")
         
-        print("\n" + "="*70)
-        print("SUCCESS: All files generated without information leakage!")
-        print("="*70 + "\n")
+        print(f"\n{_BAR}\nSUCCESS: All files generated without information leakage!\n{_BAR}\n")
         
         # Show workflow
         print("Workflow Summary:")
@@ -381,9 +651,7 @@ Note on Translation Restoration:
         print("\n✓ Confidential information protected throughout the process")
         return 0
     else:
-        print("\n" + "="*70)
-        print("PIPELINE FAILED")
-        print("="*70 + "\n")
+        print(f"\n{_BAR}\nPIPELINE FAILED\n{_BAR}\n")
         return 1
 
 
@@ -15,9 +15,17 @@ Example:
 import sys
 import os
 import argparse
+import functools
 import re
+import runpy
 from pathlib import Path
 
+# Optional: Aho-Corasick finds all codes in a single linear pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Import confidential terms configuration
 try:
     from confidential_terms import CONFIDENTIAL_TERMS, ADVANCED_PATTERNS
@@ -32,17 +40,43 @@ except ImportError:
     ADVANCED_PATTERNS = []
 
 
-def create_reverse_mapping():
+def create_reverse_mapping(terms_path=None):
     """
     Create a reverse mapping from sanitized codes back to original terms.
     
+    Besides the lookup table, one compiled alternation over all codes is
+    returned, so restoring a text is a single regex pass instead of one
+    replace per code. The mapping is memoized per terms file and its modification time, so
+    repeated restores reuse it and an edited file is picked up again.
+    
+    Args:
+        terms_path (str, optional): Python file defining CONFIDENTIAL_TERMS.
+            If None, the imported confidential_terms.py (or the built-in
+            fallback terms) is used
+    
     Returns:
-        dict: Mapping of sanitized codes to original terms
+        tuple: (compiled pattern or None if there are no codes,
+                dict mapping sanitized codes to original terms)
     """
+    if terms_path is None:
+        return _build_reverse_mapping(None, None)
+    
+    terms_path = os.path.abspath(terms_path)
+    return _build_reverse_mapping(terms_path, os.path.getmtime(terms_path))
+
+
+@functools.lru_cache(maxsize=4)
+def _build_reverse_mapping(terms_path, mtime):
+    """Build the reverse mapping for create_reverse_mapping() (cached)."""
+    if terms_path is None:
+        terms = CONFIDENTIAL_TERMS
+    else:
+        terms = runpy.run_path(terms_path)['CONFIDENTIAL_TERMS']
+    
     reverse_map = {}
     
     # Create reverse mapping from CONFIDENTIAL_TERMS
-    for original_pattern, replacement_code in CONFIDENTIAL_TERMS.items():
+    for original_pattern, replacement_code in terms.items():
         # Remove regex characters to get the actual term
         original_term = original_pattern.replace(r'\b', '').strip()
         
@@ -51,31 +85,200 @@ def create_reverse_mapping():
         if replacement_code not in reverse_map:
             reverse_map[replacement_code] = original_term
     
-    return reverse_map
+    if not reverse_map:
+        return None, reverse_map
+    
+    # Longest codes first so a code is never cut short by one of its
+    # prefixes (e.g. "AC" inside "ACK"); word boundaries avoid partial
+    # replacements inside longer words. The lookahead on the codes' first
+    # characters lets the regex engine skip ahead to candidate positions
+    # instead of trying the alternation at every word boundary
+    codes = sorted(reverse_map, key=len, reverse=True)
+    first_chars = ''.join(sorted({re.escape(code[0]) for code in codes}))
+    pattern = re.compile(
+        r'(?=[' + first_chars + r'])\b(?:' + '|'.join(map(re.escape, codes)) + r')\b'
+    )
+    return pattern, reverse_map
 
 
-def reverse_sanitize_text(sanitized_text):
+_WORD_RE = re.compile(r'\w+')
+
+# Up to this many codes, checking each with `in` before scanning is
+# cheaper than a scan that finds nothing; with more codes the single
+# scan wins
+PREFILTER_MAX_CODES = 4
+
+
+@functools.lru_cache(maxsize=4)
+def _compile_reverse_automaton(codes):
+    """
+    Build an Aho-Corasick automaton over the codes, if it can be used.
+    
+    Only plain word codes qualify, since the \\b check in
+    _automaton_restore() assumes the code itself starts and ends with a
+    word character.
+    
+    Args:
+        codes (tuple): Sanitized codes
+    
+    Returns:
+        ahocorasick.Automaton or None: Automaton whose values are the
+        codes, or None if pyahocorasick is missing or a code is not a
+        plain word
+    """
+    if ahocorasick is None or not all(_WORD_RE.fullmatch(code) for code in codes):
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for code in codes:
+        automaton.add_word(code, code)
+    automaton.make_automaton()
+    return automaton
+
+
+def _automaton_restore(automaton, text, reverse_map):
+    """
+    Restore codes found by the automaton, matching the regex alternation.
+    
+    Occurrences inside longer words are skipped (the \\b check, with
+    str.isalnum() plus '_' being re's \\w). Because every code is a plain
+    word, an accepted occurrence is a whole word: accepted occurrences
+    never overlap and arrive in text order, so they are spliced in as
+    the automaton reports them, in one pass with no sorting.
+    
+    Args:
+        automaton (ahocorasick.Automaton): From _compile_reverse_automaton()
+        text (str): Sanitized text
+        reverse_map (dict): Code -> original term
+    
+    Returns:
+        str: Restored text
+    """
+    last = len(text) - 1
+    parts = []
+    append = parts.append
+    position = 0
+    for end, code in automaton.iter(text):
+        start = end - len(code) + 1
+        if start:
+            before = text[start - 1]
+            if before.isalnum() or before == '_':
+                continue
+        if end != last:
+            after = text[end + 1]
+            if after.isalnum() or after == '_':
+                continue
+        append(text[position:start])
+        append(reverse_map[code])
+        position = end + 1
+    
+    if not parts:
+        return text
+    
+    append(text[position:])
+    return ''.join(parts)
+
+
+@functools.lru_cache(maxsize=4)
+def _compile_last_cut(codes):
+    """
+    Build a regex that matches a block up to its last safe cut point.
+    
+    A cut right after a non-word character that occurs in no code can
+    never split a code, and the code boundaries on both sides of the cut
+    stay the same (the start of a text counts as a non-word character).
+    
+    Args:
+        codes (tuple): Sanitized codes
+    
+    Returns:
+        re.Pattern: Pattern whose match().end() is the cut position, or
+        that does not match if the block has no safe cut point
+    """
+    code_chars = ''.join(sorted({re.escape(char) for char in ''.join(codes)}))
+    return re.compile(r'.*[^\w' + code_chars + r']', re.DOTALL)
+
+
+# Build the default mapping (and its automaton) at import time, like the
+# patterns in sanitize.py, so the first restore does not pay for it.
+# CONFIDENTIAL_TERMS is fixed once imported, so this is what
+# create_reverse_mapping() returns without a terms file
+DEFAULT_MAPPING = create_reverse_mapping()
+if ahocorasick is not None and DEFAULT_MAPPING[1]:
+    _compile_reverse_automaton(tuple(DEFAULT_MAPPING[1]))
+
+
+def reverse_sanitize_text(sanitized_text, mapping=None):
     """
     Convert sanitized text back to original form.
     
     Args:
         sanitized_text (str): Sanitized text with replaced terms
+        mapping (tuple, optional): (pattern, dict) from create_reverse_mapping().
+            Defaults to DEFAULT_MAPPING
     
     Returns:
         str: Text with original confidential information restored
     """
-    restored_text = sanitized_text
+    pattern, reverse_map = mapping if mapping is not None else DEFAULT_MAPPING
+    if pattern is None:
+        return sanitized_text
+    
+    # Texts without any code (common for short summaries) are returned
+    # after a few C-level substring searches
+    if len(reverse_map) <= PREFILTER_MAX_CODES and not any(code in sanitized_text for code in reverse_map):
+        return sanitized_text
+    
+    # The automaton is faster than the alternation even for a couple of
+    # codes; without pyahocorasick the lookup is skipped altogether
+    if ahocorasick is not None:
+        automaton = _compile_reverse_automaton(tuple(reverse_map))
+        if automaton is not None:
+            return _automaton_restore(automaton, sanitized_text, reverse_map)
+    
+    return pattern.sub(lambda m: reverse_map[m.group()], sanitized_text)
+
+
+def restore_file(input_path, output_path, mapping=None, block_size=1 << 16):
+    """
+    Write a restored copy of a sanitized file without loading it all at once.
+    
+    The input is restored in blocks of about ``block_size`` characters,
+    each cut after its last character that cannot be part of a code
+    (e.g. a space or a line break), so no code is split across blocks;
+    the rest of the block is carried over into the next one. Only the
+    newly read part of a block is searched for the cut, so files without
+    line breaks, or with \r line endings only, are still read in linear
+    time.
+    
+    Args:
+        input_path (str): Path of the sanitized UTF-8 text file
+        output_path (str): Path for the restored copy
+        mapping (tuple, optional): (pattern, dict) from create_reverse_mapping()
+        block_size (int, optional): Characters read per block
     
-    # Get reverse mapping
-    reverse_map = create_reverse_mapping()
+    Returns:
+        str: output_path
+    """
+    if mapping is None:
+        mapping = DEFAULT_MAPPING
+    last_cut = _compile_last_cut(tuple(mapping[1]))
     
-    # Apply reverse replacements
-    for code, original_term in reverse_map.items():
-        # Use word boundaries to avoid partial replacements
-        pattern = r'\b' + re.escape(code) + r'\b'
-        restored_text = re.sub(pattern, original_term, restored_text)
+    # newline='' keeps line endings exactly as they are in the input
+    with open(input_path, 'r', encoding='utf-8', newline='', buffering=block_size) as src, \
+            open(output_path, 'w', encoding='utf-8', newline='', buffering=block_size) as dst:
+        pending = []
+        for block in iter(lambda: src.read(block_size), ''):
+            match = last_cut.match(block)
+            if match is None:
+                pending.append(block)
+                continue
+            pending.append(block[:match.end()])
+            dst.write(reverse_sanitize_text(''.join(pending), mapping))
+            pending = [block[match.end():]]
+        dst.write(reverse_sanitize_text(''.join(pending), mapping))
     
-    return restored_text
+    return output_path
 
 
 def process_sanitized_file(sanitized_file_path, output_path=None):
@@ -90,39 +293,37 @@ def process_sanitized_file(sanitized_file_path, output_path=None):
         bool: True if successful, False otherwise
     """
     try:
-        # Check if input file exists
-        if not os.path.exists(sanitized_file_path):
-            print(f"Error: File '{sanitized_file_path}' not found.")
-            return False
-        
-        # Read sanitized text
-        with open(sanitized_file_path, 'r', encoding='utf-8') as f:
-            sanitized_text = f.read()
-        
-        # Restore to original
-        restored_text = reverse_sanitize_text(sanitized_text)
+        # One mapping for both the restore and the report below
+        mapping = DEFAULT_MAPPING
+        reverse_map = mapping[1]
         
         # Determine output path
         if output_path is None:
             # Remove _sanitized suffix and add _restored
-            base_name = Path(sanitized_file_path).stem
-            extension = Path(sanitized_file_path).suffix
+            sanitized_path = Path(sanitized_file_path)
+            base_name = sanitized_path.stem
+            extension = sanitized_path.suffix
             
             if base_name.endswith('_sanitized'):
                 base_name = base_name.replace('_sanitized', '')
             
             output_path = f"{base_name}_restored{extension}"
         
-        # Save restored text
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(restored_text)
+        # Restore to original, streaming from input to output
+        # (a missing input file surfaces here, no separate existence check)
+        try:
+            restore_file(sanitized_file_path, output_path, mapping)
+        except FileNotFoundError as e:
+            if e.filename != sanitized_file_path:
+                raise
+            print(f"Error: File '{sanitized_file_path}' not found.")
+            return False
         
         print(f"✓ Input file: {sanitized_file_path}")
         print(f"✓ Output file: {output_path}")
         print(f"✓ Restoration completed successfully!")
         
         # Show what was restored
-        reverse_map = create_reverse_mapping()
         if reverse_map:
             print(f"\n📝 Restored terms:")
             for code, original in reverse_map.items():
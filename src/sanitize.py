@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Text Sanitization
+
+Replaces confidential information in transcriptions using the terms and
+patterns configured in confidential_terms.py. Shared by main.py and the
+test scripts; reverse_sanitize.py performs the opposite direction.
+
+All patterns are compiled once at import. Literal terms are replaced with
+str.replace or an Aho-Corasick automaton (pyahocorasick), the remaining
+regex terms with one re alternation (Hyperscan, when installed, first
+checks whether any of them matches at all). ADVANCED_PATTERNS are applied
+one after another, like re.sub in a loop.
+
+Usage:
+    from sanitize import sanitize_text, sanitize_file
+"""
+
+import os
+import mmap
+import re
+
+# Optional: Hyperscan gives a much faster multi-pattern scan than Python's re
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Optional: Aho-Corasick matches all literal terms in a single linear pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Import confidential terms configuration
+try:
+    from confidential_terms import CONFIDENTIAL_TERMS, ADVANCED_PATTERNS
+except ImportError:
+    # Fallback to default terms if config file not found
+    CONFIDENTIAL_TERMS = {
+        r'Anh chị': 'AC',
+        r'anh chị': 'AC',
+        r'Kiến thức': 'KT',
+        r'kiến thức': 'KT',
+    }
+    ADVANCED_PATTERNS = []
+
+
+# Characters that make a CONFIDENTIAL_TERMS key a real regex rather than a literal
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _is_literal(pattern):
+    """Return True if a term pattern contains no regex metacharacters."""
+    return not _REGEX_METACHARACTERS.intersection(pattern)
+
+
+def _compile_union(patterns, flags=0):
+    """
+    Compile a list of regex patterns into a single alternation.
+    
+    Each pattern is wrapped in its own named group (g0, g1, ...) so the
+    matching entry can be recovered from ``match.lastgroup``.
+    
+    Args:
+        patterns (list): Regex pattern strings
+        flags (int, optional): Flags passed to re.compile
+    
+    Returns:
+        re.Pattern or None: Combined pattern, or None if there are no patterns
+    """
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(f"(?P<g{i}>{pattern})" for i, pattern in enumerate(patterns)),
+        flags
+    )
+
+
+# Constructs that refer to groups by number or name; such patterns (and
+# replacement templates with backslashes) only work on their own, not as
+# one group of an alternation
+_GROUP_REFERENCE_RE = re.compile(r'\\[1-9]|\(\?P[<=]')
+
+
+def _union_safe(patterns, replacements):
+    """Return True if the patterns can be combined with _compile_union()."""
+    return not any(_GROUP_REFERENCE_RE.search(pattern) for pattern in patterns) and \
+        not any('\\' in replacement for replacement in replacements)
+
+
+def _compile_hyperscan(patterns, caseless=False):
+    """
+    Compile patterns into a Hyperscan block-mode database.
+    
+    The database only tells whether any pattern matches; the replacements
+    are left to re, so the result is the same with or without Hyperscan.
+    
+    Args:
+        patterns (list): Regex pattern strings
+        caseless (bool, optional): Match case-insensitively
+    
+    Returns:
+        hyperscan.Database or None: Compiled database, or None if Hyperscan
+        is not installed or cannot compile one of the patterns
+    """
+    if hyperscan is None or not patterns:
+        return None
+    
+    flags = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+    if caseless:
+        flags |= hyperscan.HS_FLAG_CASELESS
+    
+    try:
+        database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        database.compile(
+            expressions=[pattern.encode('utf-8') for pattern in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=flags
+        )
+    except Exception:
+        # Unsupported construct (backreference, lookaround, ...) - use re
+        return None
+    
+    return database
+
+
+def _splice(text, matches):
+    """
+    Splice replacements into text at the given match positions.
+    
+    The heavy lifting (finding matches) happens in C inside pyahocorasick;
+    this is the only per-match Python loop. Matches are (start, priority, -end, replacement)
+    tuples: after sorting, the leftmost match wins, ties go to the lowest
+    priority (earliest pattern), then the longest match, and anything
+    overlapping an already chosen match is dropped.
+    
+    Args:
+        text (str): Text the match offsets refer to
+        matches (list): Match tuples as described above
+    
+    Returns:
+        str: Text with the chosen matches replaced
+    """
+    if not matches:
+        return text
+    
+    matches.sort()
+    parts = []
+    append = parts.append
+    position = 0
+    for start, _, negative_end, replacement in matches:
+        if start >= position:
+            append(text[position:start])
+            append(replacement)
+            position = -negative_end
+    append(text[position:])
+    
+    return ''.join(parts)
+
+
+def _hyperscan_matches(database, text):
+    """Return True if any pattern of a Hyperscan database matches text."""
+    matches = []
+    database.scan(
+        text.encode('utf-8'),
+        match_event_handler=lambda pattern_id, start, end, flags, context: matches.append(pattern_id)
+    )
+    return bool(matches)
+
+
+def _compile_automaton(terms):
+    """
+    Build a case-insensitive Aho-Corasick automaton for literal terms.
+    
+    Keys are lowercased, so terms that differ only in case collapse into
+    one entry; the first one listed keeps its replacement, as it would in
+    the regex alternation.
+    
+    Args:
+        terms (dict): Literal term -> replacement text
+    
+    Returns:
+        ahocorasick.Automaton or None: Automaton whose values are
+        (index, length, replacement), or None if pyahocorasick is not
+        installed or there are no terms
+    """
+    if ahocorasick is None or not terms:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for index, (term, replacement) in enumerate(terms.items()):
+        key = term.lower()
+        if key and automaton.get(key, None) is None:
+            automaton.add_word(key, (index, len(key), replacement))
+    automaton.make_automaton()
+    return automaton
+
+
+def _automaton_sub(automaton, text, lowered):
+    """
+    Replace all literal matches found by an Aho-Corasick automaton.
+    
+    The automaton scans the lowercased text, so ``lowered`` must have the
+    same length as ``text`` for the match offsets to line up.
+    
+    Args:
+        automaton (ahocorasick.Automaton): Automaton from _compile_automaton
+        text (str): Text to process
+        lowered (str): ``text.lower()``
+    
+    Returns:
+        str: Text with all matches replaced
+    """
+    return _splice(text, [
+        (end - length + 1, index, -end - 1, replacement)
+        for end, (index, length, replacement) in automaton.iter(lowered)
+    ])
+
+
+def _overlaps(a, b):
+    """Return True if occurrences of strings a and b can overlap in a text."""
+    if a in b or b in a:
+        return True
+    return any(a.endswith(b[:i]) or b.endswith(a[:i]) for i in range(1, min(len(a), len(b))))
+
+
+def _compile_literal_replacer(terms):
+    """
+    Specialize literal-term replacement into chained str.replace calls.
+    
+    str.replace runs a C loop per term, which beats any regex for a small
+    dictionary of exact-case terms. The returned function only handles the
+    casings listed in ``terms``; if another casing of a term (e.g. "ANH
+    CHỊ") is still present afterwards it returns None and the caller falls
+    back to a case-insensitive engine.
+    
+    Chaining is only equivalent to a single alternation pass when matches
+    cannot interact, so no function is built if two terms can overlap, a
+    replacement can form or overlap a term, or case variants of one term
+    map to different replacements.
+    
+    Args:
+        terms (dict): Literal term -> replacement text
+    
+    Returns:
+        callable or None: Function text -> sanitized text (or None)
+    """
+    if not terms:
+        return None
+    
+    folded = {}
+    for term, replacement in terms.items():
+        if not term or folded.setdefault(term.lower(), replacement) != replacement:
+            return None
+    
+    keys = list(folded)
+    replacements = [replacement.lower() for replacement in folded.values()]
+    for i, key in enumerate(keys):
+        for other in keys[i + 1:] + replacements:
+            if _overlaps(key, other):
+                return None
+    
+    items = list(terms.items())
+    
+    def replace_literals(text):
+        for term, replacement in items:
+            text = text.replace(term, replacement)
+        lowered = text.lower()
+        if len(lowered) != len(text) or any(key in lowered for key in keys):
+            return None
+        return text
+    
+    return replace_literals
+
+
+def _regex_sub(compiled_hs, compiled_re, replacements, text):
+    """
+    Apply a compiled pattern union, or a list of patterns one by one.
+    
+    Args:
+        compiled_hs (hyperscan.Database or None): Result of _compile_hyperscan,
+            used to skip texts without any match
+        compiled_re (re.Pattern, list or None): Result of _compile_union, or
+            compiled patterns to apply in order
+        replacements (list): Replacement for each pattern (literal text for
+            a union, a re.sub template for a list)
+        text (str): Text to process
+    
+    Returns:
+        str: Text with all matches replaced
+    """
+    if compiled_re is None or (compiled_hs is not None and not _hyperscan_matches(compiled_hs, text)):
+        return text
+    if isinstance(compiled_re, list):
+        for pattern, replacement in zip(compiled_re, replacements):
+            text = pattern.sub(replacement, text)
+        return text
+    return compiled_re.sub(lambda m: replacements[int(m.lastgroup[1:])], text)
+
+
+def _compile_terms(patterns, replacements, flags=0):
+    """
+    Compile regex terms for _regex_sub().
+    
+    Returns:
+        re.Pattern, list or None: One alternation when the patterns can be
+        combined, else the compiled patterns in order (None if there are none)
+    """
+    if not patterns:
+        return None
+    if _union_safe(patterns, replacements):
+        return _compile_union(patterns, flags)
+    return [re.compile(pattern, flags) for pattern in patterns]
+
+
+# Compile the sanitization patterns once at import time so every call to
+# sanitize_text() is a single pass over the text per pattern group.
+_TERMS_REPLACEMENTS = list(CONFIDENTIAL_TERMS.values())
+_TERMS_RE = _compile_terms(list(CONFIDENTIAL_TERMS), _TERMS_REPLACEMENTS, re.IGNORECASE)
+_TERMS_HS = _compile_hyperscan(list(CONFIDENTIAL_TERMS), caseless=True)
+
+# Literal terms go through str.replace or Aho-Corasick; only true regexes
+# need the union
+_LITERAL_TERMS = {term: replacement for term, replacement in CONFIDENTIAL_TERMS.items() if _is_literal(term)}
+_TERMS_FAST = _compile_literal_replacer(_LITERAL_TERMS)
+_TERMS_AC = _compile_automaton(_LITERAL_TERMS)
+_REGEX_TERMS = {term: replacement for term, replacement in CONFIDENTIAL_TERMS.items() if not _is_literal(term)}
+_REGEX_TERMS_REPLACEMENTS = list(_REGEX_TERMS.values())
+_REGEX_TERMS_RE = _compile_terms(list(_REGEX_TERMS), _REGEX_TERMS_REPLACEMENTS, re.IGNORECASE)
+_REGEX_TERMS_HS = _compile_hyperscan(list(_REGEX_TERMS), caseless=True)
+
+# ADVANCED_PATTERNS are applied in order, each with its own re.sub, so
+# later patterns see earlier replacements and \1-style templates work
+_ADVANCED_PATTERNS = [(re.compile(pattern), replacement) for pattern, replacement in ADVANCED_PATTERNS]
+
+
+def sanitize_text(text):
+    """
+    Replace confidential information in the transcribed text.
+    
+    Args:
+        text (str): Original text to sanitize
+    
+    Returns:
+        str: Sanitized text with confidential information replaced
+    """
+    # Apply replacements from CONFIDENTIAL_TERMS (case-insensitive)
+    fast_text = _TERMS_FAST(text) if _TERMS_FAST is not None else None
+    lowered = text.lower() if fast_text is None and _TERMS_AC is not None else None
+    if fast_text is not None:
+        # Only the listed casings occurred - str.replace handled them all
+        sanitized_text = _regex_sub(_REGEX_TERMS_HS, _REGEX_TERMS_RE, _REGEX_TERMS_REPLACEMENTS, fast_text)
+    elif lowered is not None and len(lowered) == len(text):
+        sanitized_text = _automaton_sub(_TERMS_AC, text, lowered)
+        sanitized_text = _regex_sub(_REGEX_TERMS_HS, _REGEX_TERMS_RE, _REGEX_TERMS_REPLACEMENTS, sanitized_text)
+    else:
+        # No automaton, or lower() changed the length (e.g. 'İ') so offsets
+        # would not line up - scan every term with the regex union instead
+        sanitized_text = _regex_sub(_TERMS_HS, _TERMS_RE, _TERMS_REPLACEMENTS, text)
+    
+    # Apply advanced patterns (none are configured by default)
+    for pattern, replacement in _ADVANCED_PATTERNS:
+        sanitized_text = pattern.sub(replacement, sanitized_text)
+    
+    return sanitized_text
+
+
+def sanitize_file(input_path, output_path, block_size=1 << 20):
+    """
+    Write a sanitized copy of a text file without loading it all at once.
+    
+    The input is memory-mapped read-only and sanitized in blocks of about
+    ``block_size`` bytes, each cut at a newline so no line (and no
+    confidential term) is split across blocks.
+    
+    Args:
+        input_path (str): Path of the UTF-8 text file to sanitize
+        output_path (str): Path for the sanitized copy
+        block_size (int, optional): Approximate bytes per block
+    
+    Returns:
+        str: output_path
+    """
+    # newline='' keeps line endings exactly as they are in the input
+    with open(input_path, 'rb') as src, \
+            open(output_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as dst:
+        # mmap cannot map an empty file
+        if os.fstat(src.fileno()).st_size == 0:
+            return output_path
+        
+        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            start = 0
+            while start < size:
+                end = mm.find(b"\n", min(start + block_size, size))
+                end = size if end == -1 else end + 1
+                dst.write(sanitize_text(mm[start:end].decode('utf-8')))
+                start = end
+    
+    return output_path
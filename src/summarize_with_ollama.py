@@ -19,7 +19,9 @@ Requirements:
 import sys
 import os
 import argparse
+import functools
 import json
+import time
 from pathlib import Path
 
 try:
@@ -31,51 +33,124 @@ except ImportError:
 
 # Import reverse sanitization function
 try:
-    from reverse_sanitize import reverse_sanitize_text, create_reverse_mapping
+    from reverse_sanitize import reverse_sanitize_text
 except ImportError:
     print("Error: reverse_sanitize.py not found in the current directory")
     sys.exit(1)
 
 
+# Last fetched model list, reused by the quiet model lookup of runs
+# started shortly after each other (see check_model_available())
+MODELS_CACHE_PATH = Path.home() / ".cache" / "video2text" / "ollama_models.json"
+MODELS_CACHE_TTL = 60  # seconds
+
+
+def _fetch_models():
+    """
+    Ask the Ollama service for its models and remember them in MODELS_CACHE_PATH.
+    
+    Returns:
+        tuple: Model names, e.g. ('llama3.2:latest',)
+    
+    Raises:
+        Exception: If the Ollama service cannot be reached
+    """
+    response = ollama.list()
+    # ollama.list() returns ListResponse object with models attribute
+    models = tuple(model.model for model in response.models)
+    
+    try:
+        MODELS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        MODELS_CACHE_PATH.write_text(json.dumps(models, separators=(',', ':')), encoding='utf-8')
+    except OSError:
+        pass
+    
+    return models
+
+
+@functools.lru_cache(maxsize=1)
+def _list_models():
+    """
+    Return the names of the models installed in Ollama.
+    
+    The list is looked up once per process (check_ollama_service() looks
+    it up again) and used by check_model_available(); call
+    _list_models.cache_clear() to forget it. Errors are not cached.
+    
+    Returns:
+        tuple: Model names, e.g. ('llama3.2:latest',)
+    """
+    return _fetch_models()
+
+
+def _recent_models():
+    """
+    Return the model list saved in MODELS_CACHE_PATH less than
+    MODELS_CACHE_TTL seconds ago, or None.
+    """
+    try:
+        if time.time() - MODELS_CACHE_PATH.stat().st_mtime < MODELS_CACHE_TTL:
+            return tuple(json.loads(MODELS_CACHE_PATH.read_text(encoding='utf-8')))
+    except (OSError, ValueError):
+        pass
+    return None
+
+
 def check_ollama_service():
     """
     Check if Ollama service is running and accessible.
     
+    Always asks the service (one request for the model list), so a
+    stopped Ollama is reported even if the model list is still cached.
+    
     Returns:
         bool: True if Ollama is running, False otherwise
     """
     try:
-        # Try to list available models
-        ollama.list()
+        # Try to list available models; model lookups reuse the fresh list
+        _list_models.cache_clear()
+        _list_models()
         return True
     except Exception as e:
         print(f"Error: Cannot connect to Ollama service: {e}")
         print("\nPlease ensure Ollama is installed and running:")
-        print("1. Install: https://ollama.ai/download")
+        print("1. Install: https://ollama.com/download")
         print("2. Start service: ollama serve")
         print("3. Pull a model: ollama pull llama3.2")
         return False
 
 
-def check_model_available(model_name):
+def check_model_available(model_name, quiet=False):
     """
     Check if a specific model is available in Ollama.
     
+    A quiet lookup (used to pick a model, not to report errors) that
+    comes before any other lookup in this process reuses the list saved
+    by a run less than MODELS_CACHE_TTL seconds ago instead of asking the
+    service.
+    
     Args:
         model_name: Name of the model to check
+        quiet: Do not print anything when the model is missing
         
     Returns:
         bool: True if model is available, False otherwise
     """
     try:
-        response = ollama.list()
-        # ollama.list() returns ListResponse object with models attribute
-        available_models = [model.model for model in response.models]
+        available_models = None
+        if quiet and not _list_models.cache_info().currsize:
+            available_models = _recent_models()
+        if available_models is None:
+            available_models = _list_models()
         
-        # Check for exact match or partial match (e.g., llama3.2:latest)
-        for available in available_models:
-            if model_name in available or available.startswith(model_name):
-                return True
+        # Exact name, or the name without its tag (llama3.2 matches
+        # llama3.2:latest)
+        names = set(available_models)
+        names.update(available.split(':')[0] for available in available_models)
+        if model_name in names:
+            return True
+        if quiet:
+            return False
         
         print(f"\nModel '{model_name}' not found.")
         print("Available models:")
@@ -84,11 +159,49 @@ def check_model_available(model_name):
         print(f"\nTo download the model, run: ollama pull {model_name}")
         return False
     except Exception as e:
-        print(f"Error checking model availability: {e}")
+        if not quiet:
+            print(f"Error checking model availability: {e}")
         return False
 
 
-def summarize_text(text, model="llama3.2", custom_prompt=None, max_length=None):
+class OllamaUnavailable(RuntimeError):
+    """Raised when the Ollama service or the requested model cannot be used."""
+
+
+@functools.lru_cache(maxsize=8)
+def _ollama_status(model_name):
+    """Probe Ollama once per model; return None if usable, else the reason."""
+    if not check_ollama_service():
+        return "Ollama not available"
+    if not check_model_available(model_name):
+        return f"Model {model_name} not available"
+    return None
+
+
+def ensure_ollama_ready(model_name, recheck=False):
+    """
+    Make sure Ollama is running and the model is available.
+    
+    The outcome is cached per model, so later stages of the same run
+    reuse it instead of probing the service again.
+    
+    Args:
+        model_name: Name of the model to check
+        recheck: Probe again instead of using the cached outcome
+    
+    Raises:
+        OllamaUnavailable: If the service or the model is not available
+    """
+    if recheck:
+        MODELS_CACHE_PATH.unlink(missing_ok=True)
+        _list_models.cache_clear()
+        _ollama_status.cache_clear()
+    reason = _ollama_status(model_name)
+    if reason:
+        raise OllamaUnavailable(reason)
+
+
+def summarize_text(text, model="llama3.2", custom_prompt=None, max_length=None, stream_to=None):
     """
     Summarize text using Ollama.
     
@@ -97,6 +210,8 @@ def summarize_text(text, model="llama3.2", custom_prompt=None, max_length=None):
         model: Ollama model to use
         custom_prompt: Optional custom prompt for summarization
         max_length: Optional maximum length for summary
+        stream_to: Optional callable that receives the summary piece by
+            piece while Ollama generates it (e.g. SummaryWriter.write)
         
     Returns:
         str: Summary of the text
@@ -118,14 +233,16 @@ Summary:"""
     print("This may take a moment...")
     
     try:
-        # Call Ollama API
-        response = ollama.generate(
-            model=model,
-            prompt=prompt,
-            stream=False
-        )
+        # Call Ollama API, streaming so the summary can be written out
+        # while the rest is still being generated
+        pieces = []
+        for chunk in ollama.generate(model=model, prompt=prompt, stream=True):
+            piece = chunk['response']
+            pieces.append(piece)
+            if stream_to:
+                stream_to(piece)
         
-        summary = response['response'].strip()
+        summary = ''.join(pieces).strip()
         return summary
         
     except Exception as e:
@@ -133,6 +250,122 @@ Summary:"""
         return None
 
 
+def read_sanitized_text(path):
+    """
+    Read a UTF-8 text file in one read and one decode.
+    
+    Newlines are normalized to '\\n' as text mode would, but only when the
+    file actually contains a '\\r', so the common case skips the
+    per-chunk decoding and newline translation of the text I/O layer.
+    
+    Args:
+        path: Path of the text file
+    
+    Returns:
+        str: File contents
+    """
+    text = Path(path).read_bytes().decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+class SummaryWriter:
+    """
+    Write a summary to disk while Ollama is still generating it.
+    
+    Pieces are buffered until a line is complete; each complete line goes
+    to the sanitized summary file and, restored, to the restored summary
+    file, so both files are produced in one pass as the summary arrives.
+    Leading and trailing whitespace is dropped, matching the stripped
+    summary returned by summarize_text(). Translations are written the
+    same way (translate_text() also takes ``stream_to``). Use as a context
+    manager and pass ``write`` as summarize_text's ``stream_to``:
+        
+        with SummaryWriter(sanitized_path, restored_path) as writer:
+            summary = summarize_text(text, stream_to=writer.write)
+    
+    Args:
+        sanitized_path: Path for the sanitized summary
+        restored_path: Optional path for the restored summary
+        mapping: Optional (pattern, dict) from create_reverse_mapping()
+    """
+    
+    def __init__(self, sanitized_path, restored_path=None, mapping=None):
+        self.sanitized_path = sanitized_path
+        self.restored_path = restored_path
+        self.mapping = mapping
+        self._sanitized = None
+        self._restored = None
+        # Pieces since the last line written out; joined only when a line
+        # can be complete, so a long line costs linear time
+        self._pending = []
+        self._newline_pending = False
+        self._started = False
+    
+    def __enter__(self):
+        # Binary files: a line is encoded once and, when it holds no codes,
+        # the same bytes go to both files
+        self._sanitized = open(self.sanitized_path, 'wb')
+        if self.restored_path:
+            self._restored = open(self.restored_path, 'wb')
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            self._flush(''.join(self._pending).rstrip())
+            self._pending = []
+        finally:
+            self._sanitized.close()
+            if self._restored:
+                self._restored.close()
+    
+    def write(self, piece):
+        """Add a piece of the summary, writing out every completed line."""
+        if not self._started:
+            piece = piece.lstrip()
+            if not piece:
+                return
+            self._started = True
+        
+        self._pending.append(piece)
+        # Without a newline nothing can be cut yet; the line just grows
+        if not self._newline_pending and '\n' not in piece:
+            return
+        
+        pending = ''.join(self._pending)
+        # Cut after the last newline that is followed by text, so trailing
+        # whitespace is held back until we know it is not the end
+        cut = pending.rstrip().rfind('\n') + 1
+        if cut:
+            self._flush(pending[:cut])
+            pending = pending[cut:]
+        self._pending = [pending]
+        self._newline_pending = '\n' in pending
+    
+    def _flush(self, text):
+        data = self._encode(text)
+        self._sanitized.write(data)
+        if self._restored:
+            # Lines end at a newline, so no code is split across writes;
+            # an unchanged line comes back as the same object
+            restored = reverse_sanitize_text(text, self.mapping)
+            self._restored.write(data if restored is text else self._encode(restored))
+    
+    @staticmethod
+    def _encode(text):
+        # Translate newlines as text mode would
+        if os.linesep != '\n':
+            text = text.replace('\n', os.linesep)
+        return text.encode('utf-8')
+    
+    def discard(self):
+        """Delete the files written so far (e.g. after a failed summary)."""
+        for path in (self.sanitized_path, self.restored_path):
+            if path:
+                Path(path).unlink(missing_ok=True)
+
+
 def process_file(
     input_file, 
     model="llama3.2", 
@@ -161,42 +394,35 @@ def process_file(
     
     # Read sanitized text
     print(f"Reading: {input_path.name}")
-    with open(input_path, 'r', encoding='utf-8') as f:
-        sanitized_text = f.read()
+    sanitized_text = read_sanitized_text(input_path)
     
     print(f"Text length: {len(sanitized_text)} characters")
     
-    # Summarize the sanitized text
-    summary = summarize_text(sanitized_text, model, custom_prompt, max_length)
+    # Output paths share one base: the input stem without _sanitized
+    out_dir = input_path.parent
+    base_name = input_path.stem
+    if base_name.endswith('_sanitized'):
+        base_name = base_name[:-len('_sanitized')]
+    
+    sanitized_summary_path = out_dir / f"{base_name}_summary_sanitized.txt"
+    # Restore confidential information if requested
+    restored_summary_path = None
+    if not keep_sanitized:
+        restored_summary_path = out_dir / f"{base_name}_summary_restored.txt"
+    
+    # Summarize the sanitized text, saving the sanitized and restored
+    # summaries line by line as they are generated
+    with SummaryWriter(sanitized_summary_path, restored_summary_path) as writer:
+        summary = summarize_text(sanitized_text, model, custom_prompt, max_length, stream_to=writer.write)
     
     if summary is None:
+        writer.discard()
         print("Failed to generate summary")
         return None, None
     
     print(f"Summary generated: {len(summary)} characters")
-    
-    # Save sanitized summary
-    base_name = input_path.stem
-    # Remove _sanitized suffix if present
-    if base_name.endswith('_sanitized'):
-        base_name = base_name[:-10]
-    
-    sanitized_summary_path = input_path.parent / f"{base_name}_summary_sanitized.txt"
-    
-    with open(sanitized_summary_path, 'w', encoding='utf-8') as f:
-        f.write(summary)
     print(f"✓ Sanitized summary saved: {sanitized_summary_path.name}")
-    
-    # Restore confidential information if requested
-    restored_summary_path = None
-    if not keep_sanitized:
-        print("\nRestoring confidential information...")
-        restored_summary = reverse_sanitize_text(summary)
-        
-        restored_summary_path = input_path.parent / f"{base_name}_summary_restored.txt"
-        
-        with open(restored_summary_path, 'w', encoding='utf-8') as f:
-            f.write(restored_summary)
+    if restored_summary_path:
         print(f"✓ Restored summary saved: {restored_summary_path.name}")
     
     return str(sanitized_summary_path), str(restored_summary_path) if restored_summary_path else None
@@ -6,20 +6,30 @@ This script takes sanitized transcriptions and uses Ollama to translate them.
 The translation is then reverse-sanitized to restore confidential information.
 
 Usage:
-    python translate_with_ollama.py <sanitized_file.txt> --target-lang <language>
+    python translate_with_ollama.py <sanitized_file.txt> [...] --target-lang <language>
 
 Example:
     python translate_with_ollama.py video_sanitized.txt --target-lang English
     python translate_with_ollama.py video_sanitized.txt --target-lang Japanese
+    python translate_with_ollama.py "videos/*_sanitized.txt" --target-lang English
 
 Requirements:
     - Ollama must be installed and running locally
-    - Default model: llama3.2 (can be changed with --model)
+    - Default model: llama3.2, or qwen2.5:0.5b for short texts if it is
+      installed (can be changed with --model)
 """
 
 import sys
 import os
 import argparse
+import asyncio
+import glob
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 try:
@@ -29,125 +39,518 @@ except ImportError:
     print("Install it with: pip install ollama")
     sys.exit(1)
 
-# Import reverse sanitization function
+# Shared with summarization: the Ollama checks (one cached model list per
+# run) and writing the sanitized and restored output while it streams in
 try:
-    from reverse_sanitize import reverse_sanitize_text
+    from summarize_with_ollama import (
+        check_ollama_service, check_model_available, SummaryWriter, read_sanitized_text
+    )
+except ImportError:
+    print("Error: summarize_with_ollama.py not found in the current directory")
+    sys.exit(1)
+
+# The sanitization codes, to recognise text that needs no translation
+try:
+    from reverse_sanitize import DEFAULT_MAPPING
 except ImportError:
     print("Error: reverse_sanitize.py not found in the current directory")
     sys.exit(1)
 
 
-def check_ollama_service():
+# Without an explicit model, texts shorter than SMALL_TEXT_CHARS go to a
+# small, fast model (when it is installed) and longer ones to llama3.2
+DEFAULT_MODEL = "llama3.2"
+SMALL_MODEL = "qwen2.5:0.5b"
+SMALL_TEXT_CHARS = 500
+
+# Longer texts are translated in chunks of about this many characters,
+# several at a time, so Ollama can batch them instead of decoding one
+# long answer
+CHUNK_CHARS = 800
+MAX_CONCURRENT_CHUNKS = 4
+
+# Persistent translation cache, one entry per model and prompt (chunk)
+CACHE_PATH = Path.home() / ".cache" / "video2text" / "ollama_translate.sqlite"
+CACHE_TTL = 30 * 24 * 60 * 60  # 30 days, in seconds
+
+# Cache connections, one per thread, and the database files whose table
+# has been created
+_CACHE = threading.local()
+_CACHE_SCHEMA_READY = set()
+_CACHE_SCHEMA_LOCK = threading.Lock()
+
+# Requests currently sent to Ollama, by cache key, so identical requests
+# from other threads wait for them instead of being sent again
+_INFLIGHT = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _cache_key(prompt, model):
+    """Return the cache key for a generate request."""
+    return hashlib.sha256(f"{model}|{prompt}".encode('utf-8')).hexdigest()
+
+
+def _open_cache():
     """
-    Check if Ollama service is running and accessible.
+    Return this thread's connection to the translation cache database.
+    
+    sqlite3 connections belong to the thread that opened them, so each
+    thread opens one on first use and keeps it for every later lookup.
+    The table is created once per database file.
     
     Returns:
-        bool: True if Ollama is running, False otherwise
+        sqlite3.Connection or None: Open connection, or None if the cache
+        cannot be used
     """
+    conn = getattr(_CACHE, 'conn', None)
+    if conn is not None and _CACHE.path == CACHE_PATH:
+        return conn
     try:
-        ollama.list()
-        return True
-    except Exception as e:
-        print(f"Error: Cannot connect to Ollama service: {e}")
-        print("\nPlease ensure Ollama is installed and running:")
-        print("1. Install: https://ollama.com/download")
-        print("2. Start service: ollama serve")
-        print("3. Pull a model: ollama pull llama3.2")
-        return False
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(CACHE_PATH)
+        with _CACHE_SCHEMA_LOCK:
+            if CACHE_PATH not in _CACHE_SCHEMA_READY:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS translations "
+                    "(hash TEXT PRIMARY KEY, model TEXT, result TEXT, ts INTEGER)"
+                )
+                _CACHE_SCHEMA_READY.add(CACHE_PATH)
+    except sqlite3.Error as e:
+        print(f"⚠ Translation cache unavailable: {e}")
+        return None
+    _CACHE.conn, _CACHE.path = conn, CACHE_PATH
+    return conn
 
 
-def check_model_available(model_name):
+def get_cached_translation(prompt, model):
     """
-    Check if a specific model is available in Ollama.
+    Look up a previous response to a prompt that is younger than CACHE_TTL.
+    
+    The prompt holds the text and both languages, so it is the key
+    together with the model.
     
     Args:
-        model_name: Name of the model to check
-        
+        prompt: Translation prompt (from _build_prompt())
+        model: Ollama model
+    
     Returns:
-        bool: True if model is available, False otherwise
+        str or None: Cached translation, or None on a miss
     """
+    conn = _open_cache()
+    if conn is None:
+        return None
     try:
-        response = ollama.list()
-        # ollama.list() returns ListResponse object with models attribute
-        available_models = [model.model for model in response.models]
-        
-        for available in available_models:
-            if model_name in available or available.startswith(model_name):
-                return True
-        
-        print(f"\nModel '{model_name}' not found.")
-        print("Available models:")
-        for model in available_models:
-            print(f"  - {model}")
-        print(f"\nTo download the model, run: ollama pull {model_name}")
-        return False
-    except Exception as e:
-        print(f"Error checking model availability: {e}")
-        return False
+        row = conn.execute(
+            "SELECT result FROM translations WHERE hash = ? AND ts >= ?",
+            (_cache_key(prompt, model), int(time.time()) - CACHE_TTL)
+        ).fetchone()
+        return row[0] if row else None
+    except sqlite3.Error:
+        return None
 
 
-def translate_text(text, target_language, model="llama3.2", custom_prompt=None, source_language=None):
+def cache_translation(prompt, model, result):
     """
-    Translate text using Ollama.
+    Store a translation in the cache.
     
     Args:
-        text: Text to translate (sanitized)
-        target_language: Target language for translation
-        model: Ollama model to use
-        custom_prompt: Optional custom prompt for translation
-        source_language: Optional source language (auto-detect if None)
-        
+        prompt: Translation prompt (from _build_prompt())
+        model: Ollama model
+        result: Translated text
+    """
+    conn = _open_cache()
+    if conn is None:
+        return
+    try:
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO translations (hash, model, result, ts) VALUES (?, ?, ?, ?)",
+                (_cache_key(prompt, model), model, result, int(time.time()))
+            )
+    except sqlite3.Error as e:
+        print(f"⚠ Could not cache translation: {e}")
+
+
+# Words (and numbers) of a text, to find texts with nothing to translate
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def _is_untranslatable(text, codes=DEFAULT_MAPPING[1]):
+    """
+    Check whether a text reads the same in every language.
+    
+    Args:
+        text: Sanitized text
+        codes: Sanitization codes (default: those from confidential_terms.py)
+    
     Returns:
-        str: Translated text
+        bool: True if the text holds nothing but whitespace, numbers,
+        punctuation and sanitization codes (AC, KT)
     """
-    # Build the prompt
-    if custom_prompt:
-        prompt = custom_prompt.replace("{text}", text).replace("{target_lang}", target_language)
-        if source_language:
-            prompt = prompt.replace("{source_lang}", source_language)
-    else:
-        if source_language:
-            prompt = f"""Translate the following text from {source_language} to {target_language}.
+    return all(token.isdigit() or token in codes for token in _TOKEN_RE.findall(text))
+
+# Default prompts, filled in with str.format
+DEFAULT_PROMPT = """Translate the following text to {target_lang}.
 Maintain the original meaning and tone. Keep any abbreviations or codes (like AC, KT) unchanged.
 
 Text to translate:
 {text}
 
-Translation in {target_language}:"""
-        else:
-            prompt = f"""Translate the following text to {target_language}.
+Translation in {target_lang}:"""
+
+DEFAULT_PROMPT_WITH_SOURCE = """Translate the following text from {source_lang} to {target_lang}.
 Maintain the original meaning and tone. Keep any abbreviations or codes (like AC, KT) unchanged.
 
 Text to translate:
 {text}
 
-Translation in {target_language}:"""
+Translation in {target_lang}:"""
+
+
+def _build_prompt(text, target_language, custom_prompt=None, source_language=None):
+    """Build the translation prompt for one text (or chunk)."""
+    if custom_prompt:
+        # The short placeholders go first, so only one replace runs over
+        # the (long) text and placeholder-like strings inside it stay as is.
+        # Custom prompts may contain other braces, so no str.format here
+        prompt = custom_prompt.replace("{target_lang}", target_language)
+        if source_language:
+            prompt = prompt.replace("{source_lang}", source_language)
+        return prompt.replace("{text}", text)
+    
+    template = DEFAULT_PROMPT_WITH_SOURCE if source_language else DEFAULT_PROMPT
+    return template.format(text=text, target_lang=target_language, source_lang=source_language)
+
 
-    print(f"Translating to {target_language} using {model}...")
-    print("This may take a moment...")
+def _choose_model(text, user_choice=None):
+    """
+    Pick the Ollama model for a text.
     
-    try:
+    Args:
+        text: Text to translate (sanitized)
+        user_choice: Model requested by the caller, if any
+    
+    Returns:
+        str: user_choice if set; otherwise SMALL_MODEL for texts shorter
+        than SMALL_TEXT_CHARS if it is installed, else DEFAULT_MODEL
+    """
+    if user_choice:
+        return user_choice
+    if len(text) < SMALL_TEXT_CHARS and check_model_available(SMALL_MODEL, quiet=True):
+        return SMALL_MODEL
+    return DEFAULT_MODEL
+
+
+def _chunk_text(text, max_chars=CHUNK_CHARS):
+    """
+    Split text into chunks that are translated separately.
+    
+    Paragraphs (separated by blank lines) are packed greedily into chunks
+    of at most max_chars. A paragraph that is too long on its own is split
+    at line breaks (a transcript has one segment per line); a single line
+    is never cut.
+    
+    Args:
+        text: Text to split
+        max_chars: Maximum characters per chunk
+    
+    Returns:
+        list: [separator, chunk] pairs in order, where separator is the
+        text ('\\n\\n' or '\\n') that joined the chunk to the previous one
+    """
+    chunks = []
+    for paragraph in re.split(r'\n\s*\n', text.strip()):
+        pieces = [paragraph] if len(paragraph) <= max_chars else paragraph.split('\n')
+        separator = '\n\n'
+        for piece in pieces:
+            if chunks and len(chunks[-1][1]) + len(separator) + len(piece) <= max_chars:
+                chunks[-1][1] += separator + piece
+            else:
+                chunks.append([separator, piece])
+            separator = '\n'
+    return chunks
+
+
+def _generate_options(prompt):
+    """
+    Return the Ollama options for one translation request.
+    
+    num_predict caps the answer at about the prompt's length in
+    characters, well above the tokens a translation of the chunk needs,
+    so only runaway generations (e.g. a model repeating itself) are cut
+    short. num_ctx is left at the model's default: a different context
+    size makes Ollama reload the model, which summarization shares.
+    
+    Args:
+        prompt: Prompt to send
+    
+    Returns:
+        dict: Options for ollama.generate()
+    """
+    return {'num_predict': 256 + len(prompt)}
+
+
+async def _translate_chunks(prompts, model, concurrency, on_done=None):
+    """
+    Send one generate request per prompt, at most ``concurrency`` at a time.
+    
+    Args:
+        prompts: Prompts, one per chunk
+        model: Ollama model to use
+        concurrency: Maximum requests in flight
+        on_done: Optional callable(index, response), called as each
+            request finishes (in completion order)
+    
+    Returns:
+        list: Stripped responses, in the order of the prompts
+    """
+    client = ollama.AsyncClient()
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def generate(index, prompt):
+        async with semaphore:
+            response = await client.generate(
+                model=model, prompt=prompt, stream=False, options=_generate_options(prompt)
+            )
+        translation = response['response'].strip()
+        if on_done:
+            on_done(index, translation)
+        return translation
+    
+    return await asyncio.gather(*(generate(index, prompt) for index, prompt in enumerate(prompts)))
+
+
+def _generate(prompt, model, stream_to=None):
+    """
+    Send one generate request, optionally streaming the response.
+    
+    Args:
+        prompt: Prompt to send
+        model: Ollama model to use
+        stream_to: Optional callable that receives each piece of the
+            response as Ollama generates it
+    
+    Returns:
+        str: Stripped response
+    """
+    if stream_to is None:
         response = ollama.generate(
             model=model,
             prompt=prompt,
-            stream=False
+            stream=False,
+            options=_generate_options(prompt)
         )
+        return response['response'].strip()
+    
+    parts = []
+    for part in ollama.generate(model=model, prompt=prompt, stream=True, options=_generate_options(prompt)):
+        piece = part['response']
+        parts.append(piece)
+        stream_to(piece)
+    return ''.join(parts).strip()
+
+
+def _generate_shared(prompts, model, concurrency, on_result=None, stream_to=None):
+    """
+    Send prompts to Ollama, sharing requests that are already in flight.
+    
+    A prompt that another thread (e.g. another pipeline worker) is already
+    sending to the same model is not sent again: this call waits for that
+    request's result instead. Repeated prompts within ``prompts`` are sent
+    only once as well.
+    
+    Args:
+        prompts: Prompts, one per chunk
+        model: Ollama model to use
+        concurrency: Maximum requests in flight for this call
+        on_result: Optional callable(index, response), called for each
+            prompt as soon as its response is known
+        stream_to: Optional callable that receives the response in pieces
+            as it is generated; only used when there is a single prompt
+    
+    Returns:
+        list: Stripped responses, in the order of the prompts
+    
+    Raises:
+        Exception: Whatever the request (or the shared request) raised
+    """
+    if len(prompts) != 1:
+        stream_to = None
+    
+    keys = [_cache_key(prompt, model) for prompt in prompts]
+    positions = {}
+    futures = {}
+    owned = {}
+    with _INFLIGHT_LOCK:
+        for index, (key, prompt) in enumerate(zip(keys, prompts)):
+            positions.setdefault(key, []).append(index)
+            if key in futures:
+                continue
+            future = _INFLIGHT.get(key)
+            if future is None:
+                future = _INFLIGHT[key] = Future()
+                owned[key] = prompt
+            futures[key] = future
+    
+    def finish(key, response):
+        if on_result:
+            for index in positions[key]:
+                on_result(index, response)
+    
+    def done(key, response):
+        futures[key].set_result(response)
+        finish(key, response)
+    
+    try:
+        owned_keys = list(owned)
+        if len(owned_keys) == 1:
+            done(owned_keys[0], _generate(owned[owned_keys[0]], model, stream_to))
+        elif owned_keys:
+            asyncio.run(_translate_chunks(
+                [owned[key] for key in owned_keys], model, concurrency,
+                on_done=lambda k, response: done(owned_keys[k], response)
+            ))
+    except BaseException as e:
+        # Waiting threads get the same error instead of hanging
+        for key in owned:
+            if not futures[key].done():
+                futures[key].set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            for key in owned:
+                del _INFLIGHT[key]
+    
+    # Requests owned by other threads
+    for key, future in futures.items():
+        if key not in owned:
+            response = future.result()
+            if stream_to:
+                stream_to(response)
+            finish(key, response)
+    
+    return [futures[key].result() for key in keys]
+
+
+def translate_text(
+    text,
+    target_language,
+    model=None,
+    custom_prompt=None,
+    source_language=None,
+    max_chars=CHUNK_CHARS,
+    concurrency=MAX_CONCURRENT_CHUNKS,
+    use_cache=True,
+    stream_to=None
+):
+    """
+    Translate text using Ollama.
+    
+    Text longer than max_chars is split into chunks (see _chunk_text())
+    that are translated concurrently and joined back in order. Each chunk
+    is looked up in the persistent cache first, so repeated paragraphs
+    and reruns only send the chunks Ollama has not translated before;
+    chunks are cached as soon as they are translated.
+    
+    With ``stream_to``, the translation is handed over while it is being
+    generated: a single chunk token by token, several chunks each as soon
+    as it and all chunks before it are done.
+    
+    Args:
+        text: Text to translate (sanitized)
+        target_language: Target language for translation
+        model: Ollama model to use (None: chosen by text length, see
+            _choose_model())
+        custom_prompt: Optional custom prompt for translation
+        source_language: Optional source language (auto-detect if None)
+        max_chars: Maximum characters per chunk
+        concurrency: Maximum chunks translated at the same time
+        use_cache: Read and write the persistent translation cache
+        stream_to: Optional callable that receives the translation in
+            pieces, in order (e.g. SummaryWriter.write)
+    
+    Returns:
+        str: Translated text
+    """
+    # Blank text, or only codes and numbers, is kept as it is
+    if _is_untranslatable(text):
+        print("Nothing to translate (only codes, numbers or punctuation)")
+        if stream_to is not None:
+            stream_to(text)
+        return text
+    
+    model = _choose_model(text, model)
+    chunks = _chunk_text(text, max_chars)
+    prompts = [
+        _build_prompt(chunk, target_language, custom_prompt, source_language)
+        for _, chunk in chunks
+    ]
+    
+    if use_cache:
+        translations = [get_cached_translation(prompt, model) for prompt in prompts]
+    else:
+        translations = [None] * len(prompts)
+    missing = [i for i, translation in enumerate(translations) if translation is None]
+    cached = len(prompts) - len(missing)
+    
+    if len(prompts) == 1 and cached:
+        print("✓ Using cached translation")
+    elif cached:
+        print(f"✓ {cached} of {len(prompts)} chunks found in the translation cache")
+    
+    # A single chunk streams token by token; several chunks are streamed
+    # as the translated prefix grows
+    stream_tokens = stream_to is not None and len(prompts) == 1
+    emitted = 0
+    
+    def emit_ready():
+        nonlocal emitted
+        while emitted < len(translations) and translations[emitted] is not None:
+            stream_to((chunks[emitted][0] if emitted else '') + translations[emitted])
+            emitted += 1
+    
+    def on_result(j, translation):
+        i = missing[j]
+        translations[i] = translation
+        if use_cache and translation:
+            cache_translation(prompts[i], model, translation)
+        if stream_to is not None and not stream_tokens:
+            emit_ready()
+    
+    if stream_to is not None:
+        emit_ready()
+    
+    if missing:
+        if len(prompts) > 1:
+            print(f"Translating to {target_language} using {model} ({len(missing)} of {len(prompts)} chunks)...")
+        else:
+            print(f"Translating to {target_language} using {model}...")
+        print("This may take a moment...")
         
-        translation = response['response'].strip()
-        return translation
-        
-    except Exception as e:
-        print(f"Error during translation: {e}")
-        return None
+        try:
+            _generate_shared(
+                [prompts[i] for i in missing], model, concurrency,
+                on_result=on_result,
+                stream_to=stream_to if stream_tokens else None
+            )
+        except Exception as e:
+            print(f"Error during translation: {e}")
+            return None
+    
+    return translations[0] + ''.join(
+        separator + translation
+        for (separator, _), translation in zip(chunks[1:], translations[1:])
+    )
 
 
 def process_file(
     input_file,
     target_language,
-    model="llama3.2",
+    model=None,
     custom_prompt=None,
     source_language=None,
-    keep_sanitized=False
+    keep_sanitized=False,
+    use_cache=True
 ):
     """
     Process a sanitized file: translate and optionally restore confidential info.
@@ -155,10 +558,11 @@ def process_file(
     Args:
         input_file: Path to sanitized transcript file
         target_language: Target language for translation
-        model: Ollama model to use
+        model: Ollama model to use (None: chosen by text length)
         custom_prompt: Optional custom prompt
         source_language: Optional source language
         keep_sanitized: If True, don't reverse sanitization
+        use_cache: Reuse cached translations
         
     Returns:
         tuple: (sanitized_translation_path, restored_translation_path or None)
@@ -171,52 +575,84 @@ def process_file(
     
     # Read sanitized text
     print(f"Reading: {input_path.name}")
-    with open(input_path, 'r', encoding='utf-8') as f:
-        sanitized_text = f.read()
+    sanitized_text = read_sanitized_text(input_path)
     
     print(f"Text length: {len(sanitized_text)} characters")
     
-    # Translate the sanitized text
-    translation = translate_text(
-        sanitized_text,
-        target_language,
-        model,
-        custom_prompt,
-        source_language
-    )
+    # Output paths share one base: the input stem without _sanitized,
+    # plus a safe filename for the target language
+    out_dir = input_path.parent
+    base_name = input_path.stem
+    if base_name.endswith('_sanitized'):
+        base_name = base_name[:-len('_sanitized')]
+    safe_lang = target_language.lower().replace(' ', '_')
+    base_name = f"{base_name}_translation_{safe_lang}"
+    
+    sanitized_translation_path = out_dir / f"{base_name}_sanitized.txt"
+    # Restore confidential information if requested
+    restored_translation_path = None
+    if not keep_sanitized:
+        restored_translation_path = out_dir / f"{base_name}_restored.txt"
+    
+    # Translate the sanitized text, saving the sanitized and restored
+    # translations line by line as they are generated
+    with SummaryWriter(sanitized_translation_path, restored_translation_path) as writer:
+        translation = translate_text(
+            sanitized_text,
+            target_language,
+            model,
+            custom_prompt,
+            source_language,
+            use_cache=use_cache,
+            stream_to=writer.write
+        )
     
     if translation is None:
+        writer.discard()
         print("Failed to generate translation")
         return None, None
     
     print(f"Translation generated: {len(translation)} characters")
+    print(f"✓ Sanitized translation saved: {sanitized_translation_path.name}")
+    if restored_translation_path:
+        print(f"✓ Restored translation saved: {restored_translation_path.name}")
     
-    # Save sanitized translation
-    base_name = input_path.stem
-    if base_name.endswith('_sanitized'):
-        base_name = base_name[:-10]
+    return str(sanitized_translation_path), str(restored_translation_path) if restored_translation_path else None
+
+
+def preload_model(model):
+    """
+    Load a model into Ollama's memory before several files are translated.
     
-    # Create safe filename for target language
-    safe_lang = target_language.lower().replace(' ', '_')
-    sanitized_translation_path = input_path.parent / f"{base_name}_translation_{safe_lang}_sanitized.txt"
+    Ollama loads the model without generating anything when the prompt is
+    empty, so parallel workers start translating right away instead of
+    all waiting on the same load.
     
-    with open(sanitized_translation_path, 'w', encoding='utf-8') as f:
-        f.write(translation)
-    print(f"✓ Sanitized translation saved: {sanitized_translation_path.name}")
+    Args:
+        model: Ollama model to load
+    """
+    try:
+        ollama.generate(model=model, prompt='')
+    except Exception as e:
+        print(f"⚠ Could not preload {model}: {e}")
+
+
+def expand_inputs(patterns):
+    """
+    Expand wildcard patterns into file paths (Windows shells do not).
     
-    # Restore confidential information if requested
-    restored_translation_path = None
-    if not keep_sanitized:
-        print("\nRestoring confidential information...")
-        restored_translation = reverse_sanitize_text(translation)
-        
-        restored_translation_path = input_path.parent / f"{base_name}_translation_{safe_lang}_restored.txt"
-        
-        with open(restored_translation_path, 'w', encoding='utf-8') as f:
-            f.write(restored_translation)
-        print(f"✓ Restored translation saved: {restored_translation_path.name}")
+    Args:
+        patterns: File paths and/or glob patterns
     
-    return str(sanitized_translation_path), str(restored_translation_path) if restored_translation_path else None
+    Returns:
+        list: Paths in order; a pattern without matches is kept as is so
+        process_file() reports it as missing
+    """
+    files = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else []
+        files.extend(matches or [pattern])
+    return files
 
 
 def main():
@@ -231,16 +667,27 @@ Examples:
   # Translate to Japanese with specific model
   python translate_with_ollama.py video_sanitized.txt --target-lang Japanese --model llama2
   
+  # Translate several files, three at a time
+  python translate_with_ollama.py "videos/*_sanitized.txt" --target-lang English --workers 3
+  
   # Keep translation sanitized (don't restore)
   python translate_with_ollama.py video_sanitized.txt --target-lang English --keep-sanitized
   
   # Specify source language explicitly
   python translate_with_ollama.py video_sanitized.txt --target-lang English --source-lang Vietnamese
   
+  # Force a fresh translation instead of using the cache
+  python translate_with_ollama.py video_sanitized.txt --target-lang English --no-cache
+  
   # Use custom prompt
   python translate_with_ollama.py video_sanitized.txt --target-lang English \\
     --prompt "Translate professionally from {source_lang} to {target_lang}: {text}"
 
+Model Routing:
+  Without --model, texts shorter than 500 characters are translated with the
+  small qwen2.5:0.5b model (if installed: ollama pull qwen2.5:0.5b) and longer
+  texts with llama3.2. --model uses the given model for every text.
+
 Privacy Protection:
   - Ollama receives ONLY sanitized text (confidential terms are replaced with codes)
   - Translation preserves the codes (AC, KT, etc.)
@@ -261,7 +708,8 @@ Important Note:
     
     parser.add_argument(
         'input_file',
-        help='Path to sanitized transcript file'
+        nargs='+',
+        help='Path(s) or wildcard patterns of sanitized transcript files'
     )
     
     parser.add_argument(
@@ -277,8 +725,8 @@ Important Note:
     
     parser.add_argument(
         '--model', '-m',
-        default='llama3.2',
-        help='Ollama model to use (default: llama3.2)'
+        help=f'Ollama model to use (default: {SMALL_MODEL} for texts under '
+             f'{SMALL_TEXT_CHARS} characters if installed, otherwise {DEFAULT_MODEL})'
     )
     
     parser.add_argument(
@@ -292,6 +740,19 @@ Important Note:
         help='Keep translation sanitized (do not restore confidential info)'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=2,
+        help='Files translated in parallel when several are given (default: 2)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the translation cache'
+    )
+    
     parser.add_argument(
         '--check',
         action='store_true',
@@ -307,11 +768,12 @@ Important Note:
     # If --check flag, just show info and exit
     if args.check:
         print("\n✓ Ollama service is running")
-        check_model_available(args.model)
+        check_model_available(args.model or DEFAULT_MODEL)
         sys.exit(0)
     
-    # Check if model is available
-    if not check_model_available(args.model):
+    # Check if model is available (short texts fall back to the default
+    # model when the small one is not installed)
+    if not check_model_available(args.model or DEFAULT_MODEL):
         sys.exit(1)
     
     # Process the file
@@ -319,15 +781,44 @@ Important Note:
     print("OLLAMA TRANSLATION PIPELINE")
     print("="*60 + "\n")
     
-    sanitized_path, restored_path = process_file(
-        args.input_file,
+    input_files = expand_inputs(args.input_file)
+    options = dict(
         target_language=args.target_lang,
         model=args.model,
         custom_prompt=args.prompt,
         source_language=args.source_lang,
-        keep_sanitized=args.keep_sanitized
+        keep_sanitized=args.keep_sanitized,
+        use_cache=not args.no_cache
     )
     
+    # Several files: one model load, then a few files at a time so Ollama
+    # can batch their requests
+    if len(input_files) > 1:
+        preload_model(args.model or DEFAULT_MODEL)
+        if not args.model and check_model_available(SMALL_MODEL, quiet=True):
+            preload_model(SMALL_MODEL)
+        with ThreadPoolExecutor(max_workers=max(1, min(args.workers, len(input_files)))) as executor:
+            outputs = list(executor.map(lambda input_file: process_file(input_file, **options), input_files))
+        
+        print("\n" + "="*60)
+        print("TRANSLATION COMPLETE")
+        print("="*60)
+        failed = 0
+        for input_file, (sanitized_path, restored_path) in zip(input_files, outputs):
+            if not sanitized_path:
+                failed += 1
+                print(f"✗ {Path(input_file).name}: failed")
+                continue
+            print(f"✓ {Path(input_file).name}:")
+            print(f"    Sanitized translation: {Path(sanitized_path).name}")
+            if restored_path:
+                print(f"    Restored translation: {Path(restored_path).name}")
+        
+        print(f"\n{len(input_files) - failed}/{len(input_files)} files translated to {args.target_lang}")
+        return 1 if failed else 0
+    
+    sanitized_path, restored_path = process_file(input_files[0], **options)
+    
     if sanitized_path:
         print("\n" + "="*60)
         print("TRANSLATION COMPLETE")
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Test Google Translation Helpers
+
+Checks the parts of auto_translate_google.py that do not need a browser
+or the network: splitting text into chunks for the Google Translate
+input box, reading them lazily from a file, and what process_file()
+leaves behind when a translation fails or caches by default. The module imports Selenium, requests and webdriver_manager,
+so the tests are skipped where those are not installed.
+
+Usage:
+    python -m pytest test/test_auto_translate_google.py
+"""
+
+import contextlib
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("selenium")
+pytest.importorskip("requests")
+pytest.importorskip("webdriver_manager")
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import auto_translate_google
+from auto_translate_google import _chunk_text, iter_chunks
+
+
+# One segment per line and no blank lines, like save_transcription() writes
+TRANSCRIPT = "\n".join(f"Dòng {i}: Xin chào AC. Hôm nay học KT số {i}!" for i in range(400))
+
+
+@pytest.mark.parametrize("max_chars", [100, 1000, 4500])
+def test_long_transcript_is_split_at_line_breaks(max_chars):
+    chunks = _chunk_text(TRANSCRIPT, max_chars)
+    
+    assert len(chunks) > 1
+    assert all(len(chunk) <= max_chars for chunk in chunks)
+    # Every line stays whole and keeps its line break
+    assert "\n".join(chunks) == TRANSCRIPT
+
+
+def test_paragraphs_are_packed_together():
+    text = "Đoạn một.\nDòng hai.\n\nĐoạn hai.\n\nĐoạn ba."
+    assert _chunk_text(text, 25) == ["Đoạn một.\nDòng hai.", "Đoạn hai.\n\nĐoạn ba."]
+
+
+def test_only_an_overlong_line_is_split_into_sentences():
+    long_line = " ".join(f"Câu {i} rất dài." for i in range(20))
+    text = f"Dòng đầu.\n{long_line}\nDòng cuối."
+    chunks = _chunk_text(text, 60)
+    
+    assert all(len(chunk) <= 60 for chunk in chunks)
+    assert chunks[0].startswith("Dòng đầu.\nCâu 0 rất dài.")
+    assert chunks[-1].endswith("rất dài.\nDòng cuối.")
+    assert " ".join(chunks).replace("\n", " ") == text.replace("\n", " ")
+
+
+def test_overlong_sentence_is_cut_hard():
+    chunks = _chunk_text("x" * 250, 100)
+    assert chunks == ["x" * 100, "x" * 100, "x" * 50]
+
+
+@pytest.mark.parametrize("text", [
+    TRANSCRIPT,
+    TRANSCRIPT + "\n",
+    "Đoạn một.\nDòng hai.\n\n\nĐoạn hai.\n\n" + TRANSCRIPT + "\n\nĐoạn cuối.",
+    "\n\n" + " ".join(f"Câu {i} rất dài." for i in range(500)) + "\n\n\n\n",
+])
+@pytest.mark.parametrize("max_chars", [60, 1000])
+def test_iter_chunks_matches_chunk_text(tmp_path, text, max_chars):
+    path = tmp_path / "video.txt"
+    path.write_text(text, encoding='utf-8')
+    
+    expected = [chunk.strip() for chunk in _chunk_text(text, max_chars) if chunk.strip()]
+    assert list(iter_chunks(path, max_chars)) == expected
+
+
+def test_long_paragraph_is_read_line_by_line():
+    lines_read = []
+    
+    def lines():
+        for line in TRANSCRIPT.splitlines(keepends=True):
+            lines_read.append(line)
+            yield line
+    
+    pieces = auto_translate_google._iter_pieces(lines(), 100)
+    chunks = auto_translate_google._pack_chunks(pieces, 100)
+    
+    assert next(chunks) == _chunk_text(TRANSCRIPT, 100)[0]
+    # Only the lines of the first chunk and the one after it have been read
+    assert len(lines_read) == 3
+
+
+@pytest.fixture
+def failing_translation(monkeypatch):
+    """Let process_file() translate the first batch, then fail."""
+    batches = []
+    
+    def fake_translate(chunks, **kwargs):
+        if batches:
+            raise RuntimeError("Google Translate did not respond")
+        batches.append(chunks)
+        return "\n\n".join(chunks)
+    
+    monkeypatch.setattr(auto_translate_google, "GoogleTranslator", lambda **kwargs: contextlib.nullcontext())
+    monkeypatch.setattr(auto_translate_google, "translate_with_google", fake_translate)
+    return batches
+
+
+def test_failed_translation_leaves_no_output(tmp_path, failing_translation):
+    source = tmp_path / "video.txt"
+    source.write_text(TRANSCRIPT, encoding='utf-8')
+    
+    with pytest.raises(SystemExit):
+        auto_translate_google.process_file(source, workers=1)
+    
+    assert len(failing_translation) == 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["video.txt"]
+
+
+def test_failed_translation_keeps_previous_output(tmp_path, failing_translation):
+    source = tmp_path / "video.txt"
+    source.write_text(TRANSCRIPT, encoding='utf-8')
+    output = tmp_path / "video_autotranslated.txt"
+    output.write_text("Bản dịch trước.", encoding='utf-8')
+    
+    with pytest.raises(SystemExit):
+        auto_translate_google.process_file(source, workers=1)
+    
+    assert output.read_text(encoding='utf-8') == "Bản dịch trước."
+    assert not (tmp_path / "video_autotranslated.txt.part").exists()
+
+
+@pytest.mark.parametrize("name, use_cache, expected", [
+    ("video_sanitized.txt", None, True),
+    ("video.txt", None, False),
+    ("video.txt", True, True),
+    ("video_sanitized.txt", False, False),
+])
+def test_only_sanitized_files_are_cached_by_default(tmp_path, monkeypatch, name, use_cache, expected):
+    source = tmp_path / name
+    source.write_text("Xin chào AC.", encoding='utf-8')
+    calls = []
+    
+    def fake_translate(chunks, **kwargs):
+        calls.append(kwargs["use_cache"])
+        return "\n\n".join(chunks)
+    
+    monkeypatch.setattr(auto_translate_google, "GoogleTranslator", lambda **kwargs: contextlib.nullcontext())
+    monkeypatch.setattr(auto_translate_google, "translate_with_google", fake_translate)
+    auto_translate_google.process_file(source, use_cache=use_cache)
+    
+    assert calls == [expected]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
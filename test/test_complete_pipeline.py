@@ -20,7 +20,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 # Import required modules
 try:
     from confidential_terms import CONFIDENTIAL_TERMS
-    from reverse_sanitize import reverse_sanitize_text, create_reverse_mapping
+    from sanitize import sanitize_text
+    from reverse_sanitize import reverse_sanitize_text, DEFAULT_MAPPING
     from summarize_with_ollama import check_ollama_service, check_model_available, summarize_text
 except ImportError as e:
     print(f"Error importing required modules: {e}")
@@ -29,24 +30,7 @@ except ImportError as e:
 
 def print_section(title):
     """Print a formatted section header."""
-    print("\n" + "="*70)
-    print(f"  {title}")
-    print("="*70 + "\n")
-
-
-def sanitize_text(text):
-    """
-    Sanitize text by replacing confidential terms.
-    (Simplified version from main.py)
-    """
-    import re
-    sanitized = text
-    
-    for pattern, replacement in CONFIDENTIAL_TERMS.items():
-        # Use case-insensitive replacement
-        sanitized = re.sub(pattern, replacement, sanitized, flags=re.IGNORECASE)
-    
-    return sanitized
+    print(f"\n{'=' * 70}\n  {title}\n{'=' * 70}\n")
 
 
 def test_pipeline_with_mock_data(use_ollama=True, model="llama3.2"):
@@ -149,12 +133,12 @@ def test_pipeline_with_mock_data(use_ollama=True, model="llama3.2"):
     # STEP 4: Restore confidential information
     print_section("STEP 4: RESTORE CONFIDENTIAL INFORMATION")
     
-    reverse_map = create_reverse_mapping()
+    mapping = DEFAULT_MAPPING
     print("Reverse mapping:")
-    for code, original in reverse_map.items():
+    for code, original in mapping[1].items():
         print(f"  '{code}' → '{original}'")
     
-    restored_summary = reverse_sanitize_text(summary)
+    restored_summary = reverse_sanitize_text(summary, mapping)
     
     print("\nRestored summary (with confidential information):")
     print("-" * 70)
@@ -4,51 +4,16 @@ Test script to demonstrate the reverse sanitization feature.
 Shows: Original → Sanitized → Restored
 """
 
-import re
 import sys
 from pathlib import Path
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from confidential_terms import CONFIDENTIAL_TERMS, ADVANCED_PATTERNS
-
-
-def sanitize_text(text):
-    """Sanitize text (forward direction)."""
-    sanitized_text = text
-    
-    for pattern, replacement in CONFIDENTIAL_TERMS.items():
-        sanitized_text = re.sub(pattern, replacement, sanitized_text, flags=re.IGNORECASE)
-    
-    for pattern, replacement in ADVANCED_PATTERNS:
-        sanitized_text = re.sub(pattern, replacement, sanitized_text)
-    
-    return sanitized_text
-
-
-def create_reverse_mapping():
-    """Create reverse mapping."""
-    reverse_map = {}
-    
-    for original_pattern, replacement_code in CONFIDENTIAL_TERMS.items():
-        original_term = original_pattern.replace(r'\b', '').strip()
-        if replacement_code not in reverse_map:
-            reverse_map[replacement_code] = original_term
-    
-    return reverse_map
-
-
-def reverse_sanitize_text(sanitized_text):
-    """Restore sanitized text (reverse direction)."""
-    restored_text = sanitized_text
-    reverse_map = create_reverse_mapping()
-    
-    for code, original_term in reverse_map.items():
-        pattern = r'\b' + re.escape(code) + r'\b'
-        restored_text = re.sub(pattern, original_term, restored_text)
-    
-    return restored_text
+# Both directions come from the real modules, so this exercises the
+# single-pass restore used by the pipeline
+from sanitize import sanitize_text
+from reverse_sanitize import reverse_sanitize_text, DEFAULT_MAPPING
 
 
 if __name__ == "__main__":
@@ -89,14 +54,16 @@ if __name__ == "__main__":
     print("VERIFICATION")
     print("=" * 70)
     
-    # Check if restoration is accurate
-    if original_text.strip() == restored_text.strip():
+    # Check if restoration is accurate; the line diff only runs on a mismatch
+    original_stripped = original_text.strip()
+    restored_stripped = restored_text.strip()
+    if original_stripped == restored_stripped:
         print("✓ SUCCESS: Restored text matches original!")
     else:
         print("✗ WARNING: Restored text differs from original")
         print("\nDifferences:")
-        original_lines = original_text.strip().split('\n')
-        restored_lines = restored_text.strip().split('\n')
+        original_lines = original_stripped.split('\n')
+        restored_lines = restored_stripped.split('\n')
         for i, (orig, rest) in enumerate(zip(original_lines, restored_lines)):
             if orig != rest:
                 print(f"  Line {i+1}:")
@@ -106,8 +73,7 @@ if __name__ == "__main__":
     print("\n" + "=" * 70)
     print("MAPPING TABLE")
     print("=" * 70)
-    reverse_map = create_reverse_mapping()
     print(f"{'Code':<15} {'→':<5} {'Original Term':<20}")
     print("-" * 70)
-    for code, original in reverse_map.items():
+    for code, original in DEFAULT_MAPPING[1].items():
         print(f"{code:<15} {'→':<5} {original:<20}")
@@ -3,37 +3,14 @@
 Test script to demonstrate the text sanitization feature.
 """
 
-import re
 import sys
 from pathlib import Path
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from confidential_terms import CONFIDENTIAL_TERMS, ADVANCED_PATTERNS
-
-
-def sanitize_text(text):
-    """
-    Replace confidential information in the transcribed text.
-    
-    Args:
-        text (str): Original text to sanitize
-    
-    Returns:
-        str: Sanitized text with confidential information replaced
-    """
-    sanitized_text = text
-    
-    # Apply replacements from CONFIDENTIAL_TERMS (case-insensitive)
-    for pattern, replacement in CONFIDENTIAL_TERMS.items():
-        sanitized_text = re.sub(pattern, replacement, sanitized_text, flags=re.IGNORECASE)
-    
-    # Apply advanced patterns
-    for pattern, replacement in ADVANCED_PATTERNS:
-        sanitized_text = re.sub(pattern, replacement, sanitized_text)
-    
-    return sanitized_text
+from confidential_terms import CONFIDENTIAL_TERMS
+from sanitize import sanitize_text
 
 
 if __name__ == "__main__":
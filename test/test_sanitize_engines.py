@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Test Sanitization Engines
+
+sanitize.py picks str.replace, Aho-Corasick (pyahocorasick), Hyperscan or
+Python's re depending on what is installed. Whatever it picks, the output
+must be the same as applying every term and advanced pattern one after
+another with re.sub, the way sanitize_text() originally worked. The same
+goes for reverse_sanitize.py, which restores codes with Aho-Corasick or
+one regex alternation instead of one re.sub per code.
+
+Usage:
+    python -m pytest test/test_sanitize_engines.py
+"""
+
+import importlib
+import re
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+
+DEFAULT_TERMS = {
+    r'Anh chị': 'AC',
+    r'anh chị': 'AC',
+    r'Kiến thức': 'KT',
+    r'kiến thức': 'KT',
+}
+
+CONFIGS = {
+    "default": (DEFAULT_TERMS, []),
+    "regex terms": ({
+        **DEFAULT_TERMS,
+        r'\d{3}-\d{3}-\d{4}': 'XXX-XXX-XXXX',
+        r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b': '[EMAIL]',
+        r'Kiến th\w+': 'KT',
+    }, []),
+    "overlapping literals": ({r'Anh chị': 'AC', r'chị em': 'CE', r'Kiến thức': 'KT'}, []),
+    "group references": ({**DEFAULT_TERMS, r'(\w+)@corp': r'\1@X'}, []),
+    "advanced patterns": (DEFAULT_TERMS, [
+        (r'\b(\w+) \1\b', r'\1'),
+        (r'\b0\d{9}\b', '[PHONE]'),
+        (r'(\d+)%', r'\1 percent'),
+        (r'a|ab', 'Z'),
+        (r'\bZ\b', 'Y'),
+    ]),
+}
+
+TEXTS = [
+    "",
+    "\n\n",
+    "Xin chào Anh chị, hôm nay học Kiến thức mới.\nCảm ơn anh chị.",
+    "XIN CHÀO ANH CHỊ, KIẾN THỨC và Kiến Thức",
+    "Anh chị em và chị em Anh chị",
+    "gọi 0912345678 hoặc 555-123-4567, mail a.b@x.com the the 50% AC",
+    "bob@corp said İstanbul Anh chị the the ab a",
+]
+
+
+def baseline_sanitize(terms, advanced, text):
+    """The original sanitize_text(): one re.sub per term, then per pattern."""
+    for pattern, replacement in terms.items():
+        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+    for pattern, replacement in advanced:
+        text = re.sub(pattern, replacement, text)
+    return text
+
+
+def baseline_reverse(reverse_map, text):
+    """The original reverse_sanitize_text(): one re.sub per code."""
+    for code, original_term in reverse_map.items():
+        text = re.sub(r'\b' + re.escape(code) + r'\b', original_term, text)
+    return text
+
+
+def load_sanitize(terms, advanced, engine):
+    """Import a fresh sanitize module with the given terms and only one optional engine."""
+    config = types.ModuleType("confidential_terms")
+    config.CONFIDENTIAL_TERMS = terms
+    config.ADVANCED_PATTERNS = advanced
+    
+    blocked = {"hyperscan", "ahocorasick"} - {engine}
+    saved = {name: sys.modules.get(name) for name in ("confidential_terms", "sanitize", *blocked)}
+    sys.modules["confidential_terms"] = config
+    sys.modules.pop("sanitize", None)
+    for name in blocked:
+        sys.modules[name] = None  # makes `import name` raise ImportError
+    try:
+        return importlib.import_module("sanitize")
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+
+@pytest.mark.parametrize("engine", ["re", "hyperscan", "ahocorasick"])
+@pytest.mark.parametrize("config", list(CONFIGS))
+def test_engines_match_baseline(engine, config):
+    if engine != "re":
+        pytest.importorskip(engine)
+    terms, advanced = CONFIGS[config]
+    sanitize = load_sanitize(terms, advanced, engine)
+    
+    for text in TEXTS:
+        assert sanitize.sanitize_text(text) == baseline_sanitize(terms, advanced, text), text
+
+
+def test_sanitize_file_matches_text(tmp_path):
+    sanitize = load_sanitize(*CONFIGS["default"], "re")
+    text = "\r\n".join(TEXTS) * 50
+    source = tmp_path / "video.txt"
+    source.write_bytes(text.encode('utf-8'))
+    
+    sanitize.sanitize_file(str(source), str(tmp_path / "video_sanitized.txt"), block_size=64)
+    
+    expected = baseline_sanitize(*CONFIGS["default"], text)
+    assert (tmp_path / "video_sanitized.txt").read_bytes().decode('utf-8') == expected
+
+
+REVERSE_TERMS = {
+    "many codes": '''
+CONFIDENTIAL_TERMS = {
+    r'Anh chị': 'AC',
+    r'Acknowledge': 'ACK',
+    r'\\bKiến thức\\b': 'KT',
+    r'Phòng một': 'P1',
+    r'Nội_bộ': 'NB_2',
+    r'Dự án': 'DA',
+    r'Khách hàng': 'KH',
+    r'Công ty': 'CT',
+    r'Thành phố': 'TP',
+    r'Hà Nội': 'HN',
+    r'Hồ Chí Minh': 'HCM',
+}
+''',
+    "few codes": '''
+CONFIDENTIAL_TERMS = {
+    r'Anh chị': 'AC',
+    r'Acknowledge': 'ACK',
+}
+''',
+}
+
+REVERSE_TEXTS = [
+    "",
+    "AC",
+    "AC ACK KT P1 NB_2 HCM",
+    "ACK, _AC, AC1, KTX, xKT, P1P1, NB_2_ và AC_",
+    "(AC) [KT]. \"P1\"\nAC\r\nKT\n",
+    "ÁAC ACé KTđ đKT, AC đã học KT ở P1 của CT tại HCM.",
+    "AC AC,AC.ACK ACK AC-KT\tKT\nAC",
+    "ACACK AC_AC AC AC",
+]
+
+
+@pytest.fixture(params=["re", "ahocorasick"])
+def reverse_sanitize(request, monkeypatch):
+    """reverse_sanitize with either Aho-Corasick or the regex alternation."""
+    import reverse_sanitize
+    if request.param == "ahocorasick":
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setattr(reverse_sanitize, "ahocorasick", None)
+    reverse_sanitize._compile_reverse_automaton.cache_clear()
+    yield reverse_sanitize
+    reverse_sanitize._compile_reverse_automaton.cache_clear()
+
+
+@pytest.mark.parametrize("terms", list(REVERSE_TERMS))
+def test_reverse_engines_match_baseline(reverse_sanitize, tmp_path, terms):
+    terms_path = tmp_path / "terms.py"
+    terms_path.write_text(REVERSE_TERMS[terms], encoding='utf-8')
+    mapping = reverse_sanitize.create_reverse_mapping(str(terms_path))
+    
+    assert mapping[1]['AC'] == 'Anh chị' and mapping[1]['ACK'] == 'Acknowledge'
+    if reverse_sanitize.ahocorasick is not None:
+        assert reverse_sanitize._compile_reverse_automaton(tuple(mapping[1])) is not None
+    for text in REVERSE_TEXTS:
+        assert reverse_sanitize.reverse_sanitize_text(text, mapping) == baseline_reverse(mapping[1], text), text
+
+
+@pytest.mark.parametrize("text", [
+    "Xin chào Anh chị, hôm nay học Kiến thức mới.",
+    "Anh chị\nKiến thức\r\n\nAnh chị và Kiến thức, Anh chị!",
+    "Không có thuật ngữ nào ở đây.",
+])
+def test_sanitize_reverse_round_trip(reverse_sanitize, text):
+    sanitize = load_sanitize(*CONFIGS["default"], "re")
+    sanitized = sanitize.sanitize_text(text)
+    
+    assert "Anh chị" not in sanitized and "Kiến thức" not in sanitized
+    assert reverse_sanitize.reverse_sanitize_text(sanitized) == text
+
+
+def test_restore_file_matches_text(reverse_sanitize, tmp_path):
+    text = "\r\n".join(REVERSE_TEXTS) * 50
+    source = tmp_path / "video_sanitized.txt"
+    source.write_bytes(text.encode('utf-8'))
+    
+    reverse_sanitize.restore_file(str(source), str(tmp_path / "video_restored.txt"), block_size=64)
+    
+    expected = reverse_sanitize.reverse_sanitize_text(text)
+    assert expected != text
+    assert (tmp_path / "video_restored.txt").read_bytes().decode('utf-8') == expected
+
+
+@pytest.mark.parametrize("separator", ["\r", " ", "", "-"])
+@pytest.mark.parametrize("block_size", [1, 3, 64])
+def test_restore_file_without_newlines(reverse_sanitize, tmp_path, separator, block_size):
+    terms_path = tmp_path / "terms.py"
+    terms_path.write_text('''
+CONFIDENTIAL_TERMS = {
+    r'Anh chị': 'AC',
+    r'Acknowledge': 'ACK',
+    r'Nội bộ': '[NB]',
+    r'Công ty': 'C-T',
+}
+''', encoding='utf-8')
+    mapping = reverse_sanitize.create_reverse_mapping(str(terms_path))
+    text = separator.join(["AC", "ACK", "[NB]", "C-T", "ACAC", "đAC", "AC_"] * 30)
+    source = tmp_path / "video_sanitized.txt"
+    source.write_bytes(text.encode('utf-8'))
+    
+    reverse_sanitize.restore_file(str(source), str(tmp_path / "video_restored.txt"), mapping, block_size=block_size)
+    
+    expected = baseline_reverse(mapping[1], text)
+    assert expected != text
+    assert (tmp_path / "video_restored.txt").read_bytes().decode('utf-8') == expected
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
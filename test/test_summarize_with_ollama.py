@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Test Ollama Summarization Helpers
+
+Checks the parts of summarize_with_ollama.py that do not need a running
+Ollama service: SummaryWriter (streamed output, split into lines and
+reverse-sanitized) and the model list behind the Ollama checks.
+
+Usage:
+    python -m pytest test/test_summarize_with_ollama.py
+"""
+
+import os
+import sys
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import summarize_with_ollama
+from summarize_with_ollama import SummaryWriter, check_model_available, check_ollama_service
+from reverse_sanitize import reverse_sanitize_text
+
+
+SUMMARY = (
+    "\n\n  Tóm tắt:\n"
+    "- AC đã học KT mới về công nghệ.\n"
+    "- KT này rất quan trọng cho AC.\n"
+    "\n"
+    "Không có mã nào ở dòng này, ACK và KTX không phải mã.\n\n"
+)
+
+
+def read_text(path):
+    """Read a file written by SummaryWriter, with newlines as in text mode."""
+    return Path(path).read_bytes().decode('utf-8').replace(os.linesep, "\n")
+
+
+def write_in_pieces(tmp_path, pieces, restored=True):
+    """Stream pieces through a SummaryWriter; return (sanitized, restored) file contents."""
+    sanitized_path = tmp_path / "summary_sanitized.txt"
+    restored_path = tmp_path / "summary_restored.txt" if restored else None
+    with SummaryWriter(sanitized_path, restored_path) as writer:
+        for piece in pieces:
+            writer.write(piece)
+    return read_text(sanitized_path), read_text(restored_path) if restored else None
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 50, len(SUMMARY)])
+def test_summary_writer_matches_whole_text(tmp_path, size):
+    # Pieces of every size split codes ("A" + "C") and newlines apart
+    pieces = [SUMMARY[i:i + size] for i in range(0, len(SUMMARY), size)]
+    sanitized, restored = write_in_pieces(tmp_path, pieces)
+    
+    assert sanitized == SUMMARY.strip()
+    assert restored == reverse_sanitize_text(SUMMARY.strip())
+    assert "Anh chị đã học Kiến thức mới" in restored
+    assert "ACK và KTX" in restored
+
+
+def test_summary_writer_long_line_in_small_pieces(tmp_path):
+    line = "AC học KT, " * 5000
+    pieces = list(line) + ["\n", "  ", "\n"] + list("cuối AC") + ["\n\n"]
+    sanitized, restored = write_in_pieces(tmp_path, pieces)
+    
+    assert sanitized == line + "\n  \ncuối AC"
+    assert restored == reverse_sanitize_text(sanitized)
+
+
+def test_summary_writer_without_restored_file(tmp_path):
+    sanitized, restored = write_in_pieces(tmp_path, ["Xin chào AC\n", "  \n"], restored=False)
+    
+    assert sanitized == "Xin chào AC"
+    assert restored is None
+    assert not (tmp_path / "summary_restored.txt").exists()
+
+
+def test_summary_writer_writes_lines_as_they_complete(tmp_path):
+    sanitized_path = tmp_path / "summary_sanitized.txt"
+    with SummaryWriter(sanitized_path) as writer:
+        writer.write("Dòng một\nDòng ")
+        writer._sanitized.flush()
+        assert read_text(sanitized_path) == "Dòng một\n"
+        writer.write("hai")
+    assert read_text(sanitized_path) == "Dòng một\nDòng hai"
+
+
+def test_summary_writer_discard(tmp_path):
+    sanitized_path = tmp_path / "summary_sanitized.txt"
+    restored_path = tmp_path / "summary_restored.txt"
+    with SummaryWriter(sanitized_path, restored_path) as writer:
+        writer.write("Xin chào AC\n")
+    writer.discard()
+    
+    assert not sanitized_path.exists()
+    assert not restored_path.exists()
+
+
+@pytest.fixture
+def fake_ollama(monkeypatch, tmp_path):
+    """Replace ollama.list() and keep the model list cache in tmp_path."""
+    calls = []
+    state = types.SimpleNamespace(running=True, models=["llama3.2:latest", "qwen2.5:0.5b"])
+    
+    def fake_list():
+        calls.append(time.time())
+        if not state.running:
+            raise ConnectionError("connection refused")
+        return types.SimpleNamespace(models=[types.SimpleNamespace(model=name) for name in state.models])
+    
+    monkeypatch.setattr(summarize_with_ollama.ollama, "list", fake_list)
+    monkeypatch.setattr(summarize_with_ollama, "MODELS_CACHE_PATH", tmp_path / "ollama_models.json")
+    summarize_with_ollama._list_models.cache_clear()
+    yield types.SimpleNamespace(calls=calls, state=state)
+    summarize_with_ollama._list_models.cache_clear()
+
+
+def test_one_request_for_service_and_model_checks(fake_ollama):
+    assert check_ollama_service()
+    assert check_model_available("llama3.2")
+    assert check_model_available("qwen2.5:0.5b")
+    assert len(fake_ollama.calls) == 1
+
+
+def test_failed_request_is_not_remembered(fake_ollama):
+    fake_ollama.state.running = False
+    assert not check_ollama_service()
+    
+    fake_ollama.state.running = True
+    assert check_ollama_service()
+    assert len(fake_ollama.calls) == 2
+
+
+def test_one_request_when_the_list_cannot_be_saved(fake_ollama, monkeypatch, tmp_path):
+    (tmp_path / "not_a_directory").write_text("", encoding='utf-8')
+    monkeypatch.setattr(summarize_with_ollama, "MODELS_CACHE_PATH", tmp_path / "not_a_directory" / "models.json")
+    
+    assert check_ollama_service()
+    assert check_model_available("llama3.2")
+    assert check_model_available("qwen2.5", quiet=True)
+    assert len(fake_ollama.calls) == 1
+
+
+def test_model_names_match_with_and_without_tag(fake_ollama):
+    assert check_model_available("llama3.2")
+    assert check_model_available("llama3.2:latest")
+    assert check_model_available("qwen2.5:0.5b")
+    assert check_model_available("qwen2.5")
+    assert not check_model_available("llama")
+    assert not check_model_available("llama3")
+    assert not check_model_available("llama2")
+
+
+def test_model_list_is_reused_by_the_next_quiet_lookup(fake_ollama):
+    assert check_model_available("llama3.2")
+    # A new process starts with an empty in-memory cache
+    summarize_with_ollama._list_models.cache_clear()
+    assert check_model_available("qwen2.5", quiet=True)
+    assert len(fake_ollama.calls) == 1
+    
+    # Lookups that report errors always ask the service
+    assert check_model_available("llama3.2")
+    assert len(fake_ollama.calls) == 2
+
+
+def test_model_list_cache_expires(fake_ollama, monkeypatch):
+    assert check_model_available("llama3.2")
+    fake_ollama.state.models = ["llama2:latest"]
+    monkeypatch.setattr(summarize_with_ollama, "MODELS_CACHE_TTL", 0)
+    summarize_with_ollama._list_models.cache_clear()
+    
+    assert check_model_available("llama2", quiet=True)
+    assert len(fake_ollama.calls) == 2
+
+
+def test_stopped_service_is_reported_despite_cached_models(fake_ollama):
+    assert check_ollama_service()
+    fake_ollama.state.running = False
+    summarize_with_ollama._list_models.cache_clear()
+    
+    assert not check_ollama_service()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Test Ollama Translation Helpers
+
+Checks the parts of translate_with_ollama.py that do not need a running
+Ollama service: finding texts with nothing to translate, chunking, the
+order of concurrently translated chunks, sharing requests that are in
+flight and the translation cache. Ollama itself is replaced by fakes.
+
+Usage:
+    python -m pytest test/test_translate_with_ollama.py
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import translate_with_ollama
+from translate_with_ollama import (
+    _chunk_text, _generate_shared, _is_untranslatable, translate_text,
+    cache_translation, get_cached_translation
+)
+
+
+TRANSCRIPT = "\n\n".join(
+    "\n".join(f"Đoạn {p} dòng {line}: Xin chào AC, học KT số {p * 10 + line}." for line in range(6))
+    for p in range(12)
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_path(monkeypatch, tmp_path):
+    """Keep the translation cache of every test in its own directory."""
+    path = tmp_path / "ollama_translate.sqlite"
+    monkeypatch.setattr(translate_with_ollama, "CACHE_PATH", path)
+    return path
+
+
+@pytest.fixture
+def fake_ollama(monkeypatch):
+    """
+    Replace the ollama module with one that upper-cases the prompt.
+    
+    Concurrent requests finish in reverse order (later prompts are answered
+    first), so results that are put back together by completion order
+    show up as wrong output. Returns the list of prompts received.
+    """
+    prompts = []
+    
+    def generate(model, prompt, stream=False, options=None):
+        prompts.append(prompt)
+        if stream:
+            return iter([{'response': prompt[:3].upper()}, {'response': prompt[3:].upper()}])
+        return {'response': prompt.upper()}
+    
+    class AsyncClient:
+        async def generate(self, model, prompt, stream=False, options=None):
+            prompts.append(prompt)
+            await asyncio.sleep(0.001 * (100 - len(prompts)))
+            return {'response': prompt.upper()}
+    
+    monkeypatch.setattr(translate_with_ollama, "ollama", types.SimpleNamespace(generate=generate, AsyncClient=AsyncClient))
+    return prompts
+
+
+@pytest.fixture
+def blocking_ollama(monkeypatch):
+    """
+    Replace the ollama module with one whose requests wait for ``release``.
+    
+    ``started`` is set once the first request has reached Ollama; setting
+    ``error`` makes the requests fail instead of answering.
+    """
+    state = types.SimpleNamespace(
+        prompts=[], started=threading.Event(), release=threading.Event(), error=None
+    )
+    
+    def generate(model, prompt, stream=False, options=None):
+        state.prompts.append(prompt)
+        state.started.set()
+        state.release.wait(5)
+        if state.error is not None:
+            raise state.error
+        return {'response': prompt.upper()}
+    
+    monkeypatch.setattr(translate_with_ollama, "ollama", types.SimpleNamespace(generate=generate))
+    return state
+
+
+@pytest.mark.parametrize("text", ["", "  \n\n", "AC KT\n", "AC, KT - 2024.\n", "12:30 (AC)"])
+def test_untranslatable_text(text):
+    assert _is_untranslatable(text)
+
+
+@pytest.mark.parametrize("text", [
+    "XIN CHAO. CAM ON.",
+    "INTRODUCTION",
+    "AC, API, KT",
+    "Xin chào AC",
+])
+def test_translatable_text(text):
+    assert not _is_untranslatable(text)
+
+
+def test_codes_only_text_is_not_sent(fake_ollama):
+    assert translate_text("AC KT\n", "English", model="llama3.2", custom_prompt="{text}") == "AC KT\n"
+    assert fake_ollama == []
+
+
+def test_upper_case_prose_is_translated(fake_ollama):
+    text = "XIN CHAO AC. CAM ON KT."
+    translation = translate_text(text, "English", model="llama3.2", custom_prompt="Translate: {text}")
+    
+    assert translation == "TRANSLATE: " + text
+    assert fake_ollama == ["Translate: " + text]
+
+
+@pytest.mark.parametrize("max_chars", [50, 200, 800, 10000])
+def test_chunks_join_back_to_the_text(max_chars):
+    chunks = _chunk_text(TRANSCRIPT, max_chars)
+    
+    assert chunks[0][1] == TRANSCRIPT[:len(chunks[0][1])]
+    assert "".join(separator + chunk for separator, chunk in chunks)[2:] == TRANSCRIPT
+    # Chunks only exceed max_chars when a single line is longer
+    for _, chunk in chunks:
+        assert len(chunk) <= max_chars or "\n" not in chunk
+
+
+def test_chunks_keep_whole_paragraphs_when_they_fit():
+    chunks = _chunk_text("a\nb\n\nc\n\n\nd", max_chars=5)
+    assert chunks == [["\n\n", "a\nb"], ["\n\n", "c\n\nd"]]
+
+
+def test_chunks_are_translated_in_order(fake_ollama):
+    translation = translate_text(
+        TRANSCRIPT, "English", model="llama3.2", custom_prompt="{text}",
+        max_chars=200, concurrency=4
+    )
+    
+    assert len(fake_ollama) == len(_chunk_text(TRANSCRIPT, 200)) > 1
+    assert translation == TRANSCRIPT.upper()
+
+
+def test_chunks_are_streamed_in_order(fake_ollama):
+    pieces = []
+    translation = translate_text(
+        TRANSCRIPT, "English", model="llama3.2", custom_prompt="{text}",
+        max_chars=200, concurrency=4, stream_to=pieces.append
+    )
+    
+    assert "".join(pieces) == translation == TRANSCRIPT.upper()
+
+
+def test_single_chunk_streams_tokens(fake_ollama):
+    pieces = []
+    translation = translate_text("Xin chào AC", "English", model="llama3.2", custom_prompt="{text}",
+                                 stream_to=pieces.append)
+    
+    assert pieces == ["XIN", " CHÀO AC"]
+    assert translation == "XIN CHÀO AC"
+
+
+def test_translations_are_cached(fake_ollama):
+    first = translate_text(TRANSCRIPT, "English", model="llama3.2", custom_prompt="{text}", max_chars=200)
+    requests = len(fake_ollama)
+    second = translate_text(TRANSCRIPT, "English", model="llama3.2", custom_prompt="{text}", max_chars=200)
+    
+    assert first == second == TRANSCRIPT.upper()
+    assert len(fake_ollama) == requests
+
+
+def test_cache_can_be_skipped(fake_ollama):
+    translate_text("Xin chào AC", "English", model="llama3.2", custom_prompt="{text}")
+    translate_text("Xin chào AC", "English", model="llama3.2", custom_prompt="{text}", use_cache=False)
+    
+    assert fake_ollama == ["Xin chào AC", "Xin chào AC"]
+
+
+def test_cache_is_per_model_and_expires(monkeypatch):
+    cache_translation("prompt", "llama3.2", "result")
+    
+    assert get_cached_translation("prompt", "llama3.2") == "result"
+    assert get_cached_translation("prompt", "qwen2.5:0.5b") is None
+    assert get_cached_translation("other prompt", "llama3.2") is None
+    
+    # An entry written now is older than a negative TTL
+    monkeypatch.setattr(translate_with_ollama, "CACHE_TTL", -1)
+    assert get_cached_translation("prompt", "llama3.2") is None
+
+
+def test_cache_is_shared_between_threads():
+    def work(i):
+        for j in range(20):
+            cache_translation(f"prompt {i} {j}", "llama3.2", f"result {i} {j}")
+        return [get_cached_translation(f"prompt {i} {j}", "llama3.2") for j in range(20)]
+    
+    threads_results = {}
+    threads = [threading.Thread(target=lambda i=i: threads_results.update({i: work(i)})) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    for i in range(4):
+        assert threads_results[i] == [f"result {i} {j}" for j in range(20)]
+        assert get_cached_translation(f"prompt {i} 0", "llama3.2") == f"result {i} 0"
+
+
+def test_requests_in_flight_are_shared(blocking_ollama):
+    results = {}
+    first = threading.Thread(target=lambda: results.update(first=_generate_shared(["xin chào"], "llama3.2", 1)))
+    second = threading.Thread(target=lambda: results.update(second=_generate_shared(["xin chào"], "llama3.2", 1)))
+    first.start()
+    assert blocking_ollama.started.wait(5)
+    second.start()
+    time.sleep(0.1)
+    blocking_ollama.release.set()
+    first.join(5)
+    second.join(5)
+    
+    assert blocking_ollama.prompts == ["xin chào"]
+    assert results == {"first": ["XIN CHÀO"], "second": ["XIN CHÀO"]}
+    assert translate_with_ollama._INFLIGHT == {}
+
+
+def test_failed_request_is_reported_to_waiting_threads(blocking_ollama):
+    blocking_ollama.error = ConnectionError("Ollama stopped")
+    errors = []
+    
+    def call():
+        try:
+            _generate_shared(["xin chào"], "llama3.2", 1)
+        except ConnectionError as e:
+            errors.append(str(e))
+    
+    threads = [threading.Thread(target=call) for _ in range(2)]
+    threads[0].start()
+    assert blocking_ollama.started.wait(5)
+    threads[1].start()
+    time.sleep(0.1)
+    blocking_ollama.release.set()
+    for thread in threads:
+        thread.join(5)
+    
+    assert blocking_ollama.prompts == ["xin chào"]
+    assert errors == ["Ollama stopped", "Ollama stopped"]
+    assert translate_with_ollama._INFLIGHT == {}
+
+
+def test_repeated_prompts_are_sent_once(fake_ollama):
+    results = _generate_shared(["a", "b", "a"], "llama3.2", 2)
+    
+    assert results == ["A", "B", "A"]
+    assert sorted(fake_ollama) == ["a", "b"]
+
+
+def test_short_texts_use_the_small_model_when_installed(monkeypatch):
+    monkeypatch.setattr(translate_with_ollama, "check_model_available", lambda name, quiet=False: True)
+    assert translate_with_ollama._choose_model("Xin chào") == translate_with_ollama.SMALL_MODEL
+    assert translate_with_ollama._choose_model("x" * 600) == translate_with_ollama.DEFAULT_MODEL
+    assert translate_with_ollama._choose_model("Xin chào", "llama2") == "llama2"
+    
+    monkeypatch.setattr(translate_with_ollama, "check_model_available", lambda name, quiet=False: False)
+    assert translate_with_ollama._choose_model("Xin chào") == translate_with_ollama.DEFAULT_MODEL
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -19,6 +19,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 # Import required modules
 try:
     from confidential_terms import CONFIDENTIAL_TERMS
+    from sanitize import sanitize_text
     from reverse_sanitize import reverse_sanitize_text
     from translate_with_ollama import check_ollama_service, check_model_available, translate_text
 except ImportError as e:
@@ -26,22 +27,18 @@ except ImportError as e:
     sys.exit(1)
 
 
+_BAR = "=" * 70
+_RULE = "-" * 70
+
+
 def print_section(title):
     """Print a formatted section header."""
-    print("\n" + "="*70)
-    print(f"  {title}")
-    print("="*70 + "\n")
+    print(f"\n{_BAR}\n  {title}\n{_BAR}\n")
 
 
-def sanitize_text(text):
-    """Sanitize text by replacing confidential terms."""
-    import re
-    sanitized = text
-    
-    for pattern, replacement in CONFIDENTIAL_TERMS.items():
-        sanitized = re.sub(pattern, replacement, sanitized, flags=re.IGNORECASE)
-    
-    return sanitized
+def print_lines(lines):
+    """Print a block of lines with a single write."""
+    print("\n".join(lines))
 
 
 def test_translation(use_ollama=True, model="llama3.2", target_lang="English"):
@@ -67,28 +64,28 @@ def test_translation(use_ollama=True, model="llama3.2", target_lang="English"):
     """
     
     print_section("STEP 1: ORIGINAL TEXT (Vietnamese)")
-    print("Original text (with confidential information):")
-    print("-" * 70)
-    print(mock_transcription.strip())
-    print("-" * 70)
+    print_lines([
+        "Original text (with confidential information):",
+        _RULE,
+        mock_transcription.strip(),
+        _RULE,
+    ])
     
     # STEP 2: Sanitize
     print_section("STEP 2: SANITIZATION")
-    print("Replacing confidential terms:")
+    lines = ["Replacing confidential terms:"]
     for original, replacement in CONFIDENTIAL_TERMS.items():
-        print(f"  '{original}' → '{replacement}'")
+        lines.append(f"  '{original}' → '{replacement}'")
     
     sanitized_text = sanitize_text(mock_transcription)
-    print("\nSanitized text (sent to Ollama):")
-    print("-" * 70)
-    print(sanitized_text.strip())
-    print("-" * 70)
+    lines += ["\nSanitized text (sent to Ollama):", _RULE, sanitized_text.strip(), _RULE]
     
     # Verify sanitization
     if "Anh chị" not in sanitized_text and "anh chị" not in sanitized_text:
-        print("✓ 'Anh chị' successfully replaced with 'AC'")
+        lines.append("✓ 'Anh chị' successfully replaced with 'AC'")
     if "Kiến thức" not in sanitized_text and "kiến thức" not in sanitized_text:
-        print("✓ 'Kiến thức' successfully replaced with 'KT'")
+        lines.append("✓ 'Kiến thức' successfully replaced with 'KT'")
+    print_lines(lines)
     
     # STEP 3: Translate
     print_section(f"STEP 3: TRANSLATION TO {target_lang.upper()}")
@@ -144,53 +141,59 @@ def test_translation(use_ollama=True, model="llama3.2", target_lang="English"):
         
         print(f"Using mock translation (Ollama not available)")
     
-    print(f"\nTranslation to {target_lang} (sanitized - preserves codes):")
-    print("-" * 70)
-    print(translation.strip())
-    print("-" * 70)
-    print(f"Length: {len(translation)} characters")
+    lines = [
+        f"\nTranslation to {target_lang} (sanitized - preserves codes):",
+        _RULE,
+        translation.strip(),
+        _RULE,
+        f"Length: {len(translation)} characters",
+    ]
     
     # Verify codes are preserved
     if "AC" in translation:
-        print("✓ Code 'AC' preserved in translation")
+        lines.append("✓ Code 'AC' preserved in translation")
     if "KT" in translation:
-        print("✓ Code 'KT' preserved in translation")
+        lines.append("✓ Code 'KT' preserved in translation")
+    print_lines(lines)
     
     # STEP 4: Restore confidential information
     print_section("STEP 4: RESTORE CONFIDENTIAL INFORMATION")
     
-    print("Restoring confidential terms in translated text...")
     restored_translation = reverse_sanitize_text(translation)
     
-    print(f"\nRestored translation (with confidential information):")
-    print("-" * 70)
-    print(restored_translation.strip())
-    print("-" * 70)
+    lines = [
+        "Restoring confidential terms in translated text...",
+        f"\nRestored translation (with confidential information):",
+        _RULE,
+        restored_translation.strip(),
+        _RULE,
+    ]
     
     # Verify restoration
     if "Anh chị" in restored_translation or "anh chị" in restored_translation:
-        print("✓ Confidential term 'Anh chị' restored in translation")
+        lines.append("✓ Confidential term 'Anh chị' restored in translation")
     if "Kiến thức" in restored_translation or "kiến thức" in restored_translation:
-        print("✓ Confidential term 'Kiến thức' restored in translation")
+        lines.append("✓ Confidential term 'Kiến thức' restored in translation")
+    print_lines(lines)
     
     # STEP 5: Verification
     print_section("VERIFICATION")
     
-    print("✓ Translation Pipeline:")
-    print("  1. Original Vietnamese text → Contains confidential info")
-    print("  2. Sanitization → Confidential info replaced with codes (AC, KT)")
-    print(f"  3. Translation to {target_lang} → Ollama receives ONLY sanitized text")
-    print("  4. Translated text → Preserves codes (AC, KT remain unchanged)")
-    print("  5. Restoration → Confidential terms recovered in translated text")
-    
-    print("\n✓ Privacy Protection in Translation:")
-    print("  • Original confidential terms: 'Anh chị', 'Kiến thức'")
-    print(f"  • Ollama received: 'AC', 'KT' (no information leaked)")
-    print(f"  • Translation generated in {target_lang} with codes preserved")
-    print("  • Final output: Translated text with confidential info restored")
-    
-    print("\n🔒 CRITICAL: Ollama NEVER saw the original confidential information!")
-    print(f"   It only processed Vietnamese text with codes → {target_lang} text with codes")
+    print_lines([
+        "✓ Translation Pipeline:",
+        "  1. Original Vietnamese text → Contains confidential info",
+        "  2. Sanitization → Confidential info replaced with codes (AC, KT)",
+        f"  3. Translation to {target_lang} → Ollama receives ONLY sanitized text",
+        "  4. Translated text → Preserves codes (AC, KT remain unchanged)",
+        "  5. Restoration → Confidential terms recovered in translated text",
+        "\n✓ Privacy Protection in Translation:",
+        "  • Original confidential terms: 'Anh chị', 'Kiến thức'",
+        f"  • Ollama received: 'AC', 'KT' (no information leaked)",
+        f"  • Translation generated in {target_lang} with codes preserved",
+        "  • Final output: Translated text with confidential info restored",
+        "\n🔒 CRITICAL: Ollama NEVER saw the original confidential information!",
+        f"   It only processed Vietnamese text with codes → {target_lang} text with codes",
+    ])
     
     return True
 